@@ -17,6 +17,9 @@ from onenote_export.utils import (
     section_name_from_filename,
 )
 
+# Version date embedded in section filenames: '(On M-D-YY)' or '(On M-D-YY - N)'.
+_DATE_PATTERN = re.compile(r"\(On\s+(\d+)-(\d+)-(\d+)(?:\s*-\s*\d+)?\)")
+
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the onenote-export CLI."""
@@ -184,13 +187,11 @@ def _deduplicate_sections(files: list[Path]) -> list[Path]:
 
     Groups by section name and keeps the file with the latest date.
     """
-    date_pattern = re.compile(r"\(On\s+(\d+)-(\d+)-(\d+)(?:\s*-\s*\d+)?\)")
-
     section_versions: dict[str, list[tuple[Path, tuple[int, int, int]]]] = {}
 
     for f in files:
         section_name = section_name_from_filename(f.name)
-        match = date_pattern.search(f.name)
+        match = _DATE_PATTERN.search(f.name)
         if match:
             month, day, year = (
                 int(match.group(1)),
@@ -3,8 +3,12 @@
 Subclasses implement render_page() to produce format-specific content.
 """
 
+import functools
 import logging
+import os
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from onenote_export.model.content import EmbeddedFile, ImageElement
@@ -14,6 +18,19 @@ from onenote_export.model.section import Section
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to render and write pages of one section.
+_MAX_WORKERS = 8
+
+# Copy size for streamed image/attachment payloads.
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Characters that are invalid in filenames on at least one supported OS,
+# mapped to "_" for a single-pass str.translate.
+_SANITIZE_BAD = {ord(c): "_" for c in '<>:"/\\|?*'}
+_SANITIZE_BAD.update({c: "_" for c in range(0x20)})
+# Runs of underscores and whitespace collapse to a single space.
+_SANITIZE_WS = re.compile(r"[_\s]+")
+
 
 class BaseConverter:
     """Abstract base converter for OneNote content.
@@ -53,23 +70,53 @@ class BaseConverter:
         section_dir = base_dir / _sanitize_filename(section.name)
         section_dir.mkdir(parents=True, exist_ok=True)
 
+        # Filenames are assigned up front so duplicate-title numbering
+        # stays deterministic regardless of which page finishes first.
         seen_titles: dict[str, int] = {}
+        jobs = [
+            (page, _page_filename(page.title, seen_titles, self.FILE_EXTENSION))
+            for page in section.pages
+        ]
+
+        if len(jobs) <= 1:
+            for page, filename in jobs:
+                created.extend(self._convert_page(page, filename, section_dir))
+            return created
+
+        workers = min(_MAX_WORKERS, os.cpu_count() or 1, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(self.render_page, [page for page, _ in jobs]))
+
+        # Only rendering runs in the pool.  Pages can share a filename
+        # (e.g. "Notes", "Notes", "Notes (2)") and unnamed assets get
+        # per-page names, so all writes happen serially in page order and
+        # a collision resolves to the last page.
+        for (page, filename), content in zip(jobs, rendered):
+            created.extend(self._write_page(page, filename, section_dir, content))
 
-        for page in section.pages:
-            content = self.render_page(page)
-            filename = _page_filename(page.title, seen_titles, self.FILE_EXTENSION)
-            file_path = section_dir / filename
+        return created
 
-            file_path.write_text(content, encoding="utf-8")
-            created.append(file_path)
-            logger.info("Wrote %s", file_path)
+    def _convert_page(self, page: Page, filename: str, section_dir: Path) -> list[Path]:
+        """Render and write one page along with its images and attachments.
 
-            image_files = self._write_images(page, section_dir)
-            created.extend(image_files)
+        Returns list of created file paths.
+        """
+        return self._write_page(page, filename, section_dir, self.render_page(page))
 
-            embedded_files = self._write_embedded_files(page, section_dir)
-            created.extend(embedded_files)
+    def _write_page(
+        self, page: Page, filename: str, section_dir: Path, content: str
+    ) -> list[Path]:
+        """Write a rendered page along with its images and attachments.
+
+        Returns list of created file paths.
+        """
+        file_path = section_dir / filename
+        _write_text_fast(file_path, content)
+        logger.info("Wrote %s", file_path)
 
+        created = [file_path]
+        created.extend(self._write_images(page, section_dir))
+        created.extend(self._write_embedded_files(page, section_dir))
         return created
 
     def render_page(self, page: Page) -> str:
@@ -81,46 +128,149 @@ class BaseConverter:
 
     def _write_images(self, page: Page, section_dir: Path) -> list[Path]:
         """Write image data to files."""
+        images = [element for element in page.images if element.has_data]
+        if not images:
+            return []
+
+        info_enabled = logger.isEnabledFor(logging.INFO)
         created: list[Path] = []
         images_dir = section_dir / "images"
-        img_count = 0
-
-        for element in page.elements:
-            if isinstance(element, ImageElement) and element.data:
-                images_dir.mkdir(exist_ok=True)
-                img_count += 1
-                filename = _sanitize_filename(
-                    element.filename
-                    or f"image_{img_count:03d}.{element.format or 'bin'}"
-                )
-                img_path = images_dir / filename
-                img_path.write_bytes(element.data)
-                created.append(img_path)
+        images_dir.mkdir(exist_ok=True)
+
+        for img_count, element in enumerate(images, start=1):
+            filename = _sanitize_filename(
+                element.filename or f"image_{img_count:03d}.{element.format or 'bin'}"
+            )
+            img_path = images_dir / filename
+            _write_payload(img_path, element)
+            created.append(img_path)
+            if info_enabled:
                 logger.info("Wrote image %s", img_path)
 
         return created
 
     def _write_embedded_files(self, page: Page, section_dir: Path) -> list[Path]:
         """Write embedded file data to files."""
+        attachments = [element for element in page.embedded_files if element.has_data]
+        if not attachments:
+            return []
+
+        info_enabled = logger.isEnabledFor(logging.INFO)
         created: list[Path] = []
         attachments_dir = section_dir / "attachments"
+        attachments_dir.mkdir(exist_ok=True)
 
-        for element in page.elements:
-            if isinstance(element, EmbeddedFile) and element.data:
-                attachments_dir.mkdir(exist_ok=True)
-                filename = _sanitize_filename(element.filename or "attachment")
-                file_path = attachments_dir / filename
-                file_path.write_bytes(element.data)
-                created.append(file_path)
+        for element in attachments:
+            filename = _sanitize_filename(element.filename or "attachment")
+            file_path = attachments_dir / filename
+            _write_payload(file_path, element)
+            created.append(file_path)
+            if info_enabled:
                 logger.info("Wrote attachment %s", file_path)
 
         return created
 
 
+class _OrderedListCounter:
+    """Per-indent-level numbering for consecutive ordered list items.
+
+    Counters live in a flat list indexed by indent level.  Only levels up
+    to the most recently numbered one can be non-zero, so resets touch
+    just that prefix instead of copying or scanning a dict.
+    """
+
+    __slots__ = ("_counts", "_top")
+
+    def __init__(self) -> None:
+        self._counts = [0] * 16
+        self._top = -1  # deepest level that may hold a non-zero count
+
+    def next(self, level: int) -> int:
+        """Return the next number at *level*, resetting deeper levels."""
+        counts = self._counts
+        if level >= len(counts):
+            counts.extend([0] * (level + 1 - len(counts)))
+        for deeper in range(level + 1, self._top + 1):
+            counts[deeper] = 0
+        self._top = level
+        counts[level] += 1
+        return counts[level]
+
+    def reset(self) -> None:
+        """Restart numbering at every level."""
+        counts = self._counts
+        for lvl in range(self._top + 1):
+            counts[lvl] = 0
+        self._top = -1
+
+
+def _wrapper_table(
+    layers: tuple[tuple[str, str], ...],
+) -> tuple[tuple[str, str], ...]:
+    """Precompute (prefix, suffix) pairs for every combination of layers.
+
+    Bit *i* of the table index enables ``layers[i]``; lower bits wrap
+    closer to the text, matching the order formatting is applied in.
+    """
+    table: list[tuple[str, str]] = []
+    for flags in range(1 << len(layers)):
+        prefix = suffix = ""
+        for bit, (open_tag, close_tag) in enumerate(layers):
+            if flags & (1 << bit):
+                prefix = open_tag + prefix
+                suffix = suffix + close_tag
+        table.append((prefix, suffix))
+    return tuple(table)
+
+
+def _write_bytes_fast(path: Path, data: bytes) -> None:
+    """Write bytes with a single unbuffered write.
+
+    Skips the ``BufferedWriter`` layer that ``Path.write_bytes`` sets up
+    for every file.  Payloads of any size go straight to ``os.write``; the
+    loop only repeats if the OS accepts a short write (e.g. buffers over
+    2 GiB on Linux).  New files get ``0o666`` masked by the umask, the
+    same mode ``Path.write_bytes`` would give them.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_payload(path: Path, element: ImageElement | EmbeddedFile) -> None:
+    """Write an image or attachment payload to *path*.
+
+    Streams from ``element.data_stream`` in fixed-size chunks when it is
+    set, so very large attachments never need a second full copy in
+    memory; otherwise writes ``element.data`` in one call.  The opened
+    stream is closed afterwards.
+    """
+    if element.data_stream is None:
+        _write_bytes_fast(path, element.data)
+        return
+    with element.data_stream() as src, open(path, "wb", buffering=0) as out:
+        shutil.copyfileobj(src, out, length=_STREAM_CHUNK_SIZE)
+
+
+def _write_text_fast(path: Path, content: str) -> None:
+    """Write UTF-8 text with a single unbuffered write.
+
+    Content is written verbatim (no newline translation on Windows).
+    """
+    _write_bytes_fast(path, content.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=4096)
 def _sanitize_filename(name: str) -> str:
     """Sanitize a string for use as a filename."""
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", name)
-    sanitized = re.sub(r"[_\s]+", " ", sanitized).strip()
+    sanitized = name.translate(_SANITIZE_BAD)
+    sanitized = _SANITIZE_WS.sub(" ", sanitized).strip()
     if len(sanitized) > 200:
         sanitized = sanitized[:200]
     return sanitized or "unnamed"
@@ -133,11 +283,8 @@ def _page_filename(title: str, seen: dict[str, int], extension: str = ".md") ->
         base = f"{base}{extension}"
 
     key = base.lower()
-    if key in seen:
-        seen[key] += 1
-        stem = base[: -len(extension)]
-        base = f"{stem} ({seen[key]}){extension}"
-    else:
-        seen[key] = 1
+    count = seen[key] = seen.get(key, 0) + 1
+    if count > 1:
+        base = f"{base[: -len(extension)]} ({count}){extension}"
 
     return base
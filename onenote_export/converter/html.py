@@ -5,9 +5,17 @@ documents with embedded CSS. Images and attachments are saved as
 separate files (same as Markdown).
 """
 
+import functools
 import html
-
-from onenote_export.converter.base import BaseConverter, _sanitize_filename
+from collections.abc import Callable
+from pathlib import Path
+
+from onenote_export.converter.base import (
+    BaseConverter,
+    _OrderedListCounter,
+    _sanitize_filename,
+    _wrapper_table,
+)
 from onenote_export.model.content import (
     ContentElement,
     EmbeddedFile,
@@ -37,77 +45,125 @@ footer { color: #666; font-size: 0.9em; margin-top: 2em; }
 ul, ol { padding-left: 1.5em; }
 """
 
+# Invariant document scaffold; only the page title and body vary per page.
+_HTML_HEAD_PREFIX = (
+    "<!DOCTYPE html>\n"
+    '<html lang="en">\n'
+    "<head>\n"
+    '<meta charset="utf-8">\n'
+    '<meta name="viewport" '
+    'content="width=device-width, initial-scale=1.0">\n'
+    "<title>"
+)
+_HTML_HEAD_SUFFIX = f"</title>\n<style>\n{_CSS}</style>\n</head>\n<body>\n"
+_HTML_TAIL = "\n</body>\n</html>\n"
+
+# Inline formatting wrappers indexed by a run's flag bits:
+# bold, italic, underline, strikethrough, superscript, subscript.
+_HTML_WRAPPERS = _wrapper_table(
+    (
+        ("<strong>", "</strong>"),
+        ("<em>", "</em>"),
+        ("<u>", "</u>"),
+        ("<del>", "</del>"),
+        ("<sup>", "</sup>"),
+        ("<sub>", "</sub>"),
+    )
+)
+
+
+# Strings at most this long are memoized by _escape; longer text (whole
+# paragraphs) rarely repeats and would only bloat the cache.
+_ESCAPE_CACHE_MAX_LEN = 64
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_short(text: str) -> str:
+    return html.escape(text)
+
+
+def _escape(text: str) -> str:
+    """HTML-escape text, memoizing short strings that recur across pages."""
+    if len(text) <= _ESCAPE_CACHE_MAX_LEN:
+        return _escape_short(text)
+    return html.escape(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _html_list_wrapper(tag: str, level: int) -> tuple[str, str]:
+    """Return the (prefix, suffix) nesting a list item *level* deep."""
+    prefix = f"<{tag}>" + "<li><ul>" * level
+    suffix = "</ul></li>" * level + f"</{tag}>"
+    return prefix, suffix
+
+
+@functools.lru_cache(maxsize=64)
+def _html_indent_wrapper(level: int) -> tuple[str, str]:
+    """Return the (prefix, suffix) for indented non-list text."""
+    return "<ul>" * level, "</ul>" * level
+
 
 class HTMLConverter(BaseConverter):
     """Converts OneNote content model to self-contained HTML files."""
 
     FILE_EXTENSION = ".html"
 
+    def __init__(self, output_dir: str | Path) -> None:
+        super().__init__(output_dir)
+        self._dispatch: dict[type[ContentElement], Callable[..., str]] = {
+            RichText: self._render_rich_text,
+            ImageElement: self._render_image,
+            TableElement: self._render_table,
+            EmbeddedFile: self._render_embedded_file,
+        }
+
     def render_page(self, page: Page) -> str:
         """Render a single page to a complete HTML document."""
         body_parts: list[str] = []
 
         if page.title:
-            body_parts.append(f"<h1>{html.escape(page.title)}</h1>")
+            body_parts.append(f"<h1>{_escape(page.title)}</h1>")
 
-        ordered_counters: dict[int, int] = {}
+        ordered_counter = _OrderedListCounter()
+
+        # Bind per-element lookups to locals once for the page loop.
+        render_rich_text = self._render_rich_text
+        render_element = self._render_element
+        next_number = ordered_counter.next
+        append = body_parts.append
 
         for element in page.elements:
-            if isinstance(element, RichText) and element.list_type == "ordered":
-                level = element.indent_level
-                if level not in ordered_counters:
-                    ordered_counters[level] = 0
-                for k in list(ordered_counters):
-                    if k > level:
-                        del ordered_counters[k]
-                ordered_counters[level] += 1
-                rendered = self._render_rich_text(
+            is_rich_text = type(element) is RichText
+            if is_rich_text and element.list_type == "ordered":
+                rendered = render_rich_text(
                     element,
-                    ordered_number=ordered_counters[level],
+                    ordered_number=next_number(element.indent_level),
                 )
             else:
-                if not (isinstance(element, RichText) and element.list_type):
-                    ordered_counters.clear()
-                rendered = self._render_element(element)
+                if not (is_rich_text and element.list_type):
+                    ordered_counter.reset()
+                rendered = render_element(element)
 
             if rendered:
-                body_parts.append(rendered)
-
-        if page.author:
-            escaped_author = html.escape(page.author)
-            body_parts.append("<hr>")
-            body_parts.append(f"<footer>Author: {escaped_author}</footer>")
+                append(rendered)
 
-        title = html.escape(page.title) if page.title else "Untitled"
+        title = _escape(page.title) if page.title else "Untitled"
         body = "\n".join(body_parts)
 
+        footer = ""
+        if page.author:
+            escaped_author = _escape(page.author)
+            separator = "\n" if body_parts else ""
+            footer = f"{separator}<hr>\n<footer>Author: {escaped_author}</footer>"
+
         return (
-            "<!DOCTYPE html>\n"
-            '<html lang="en">\n'
-            "<head>\n"
-            '<meta charset="utf-8">\n'
-            '<meta name="viewport" '
-            'content="width=device-width, initial-scale=1.0">\n'
-            f"<title>{title}</title>\n"
-            f"<style>\n{_CSS}</style>\n"
-            "</head>\n"
-            "<body>\n"
-            f"{body}\n"
-            "</body>\n"
-            "</html>\n"
+            f"{_HTML_HEAD_PREFIX}{title}{_HTML_HEAD_SUFFIX}{body}{footer}{_HTML_TAIL}"
         )
 
     def _render_element(self, element: ContentElement) -> str:
         """Render a single content element to HTML."""
-        if isinstance(element, RichText):
-            return self._render_rich_text(element)
-        elif isinstance(element, ImageElement):
-            return self._render_image(element)
-        elif isinstance(element, TableElement):
-            return self._render_table(element)
-        elif isinstance(element, EmbeddedFile):
-            return self._render_embedded_file(element)
-        return ""
+        handler = self._dispatch.get(type(element))
+        return handler(element) if handler else ""
 
     def _render_rich_text(
         self,
@@ -115,6 +171,13 @@ class HTMLConverter(BaseConverter):
         ordered_number: int = 0,
     ) -> str:
         """Render rich text to HTML."""
+        if (
+            not rt.heading_level
+            and not rt.list_type
+            and not any(run.text for run in rt.runs)
+        ):
+            return ""
+
         parts: list[str] = []
 
         for run in rt.runs:
@@ -122,25 +185,24 @@ class HTMLConverter(BaseConverter):
             if not text:
                 continue
 
-            text = html.escape(text)
+            text = _escape(text)
 
             if run.hyperlink_url:
-                escaped_url = html.escape(run.hyperlink_url, quote=True)
+                escaped_url = _escape(run.hyperlink_url)
                 text = f'<a href="{escaped_url}">{text}</a>'
 
             if not rt.heading_level:
-                if run.bold:
-                    text = f"<strong>{text}</strong>"
-                if run.italic:
-                    text = f"<em>{text}</em>"
-                if run.underline and not run.hyperlink_url:
-                    text = f"<u>{text}</u>"
-                if run.strikethrough:
-                    text = f"<del>{text}</del>"
-                if run.superscript:
-                    text = f"<sup>{text}</sup>"
-                if run.subscript:
-                    text = f"<sub>{text}</sub>"
+                flags = (
+                    run.bold
+                    | run.italic << 1
+                    | (run.underline and not run.hyperlink_url) << 2
+                    | run.strikethrough << 3
+                    | run.superscript << 4
+                    | run.subscript << 5
+                )
+                if flags:
+                    prefix, suffix = _HTML_WRAPPERS[flags]
+                    text = f"{prefix}{text}{suffix}"
 
             parts.append(text)
 
@@ -152,31 +214,29 @@ class HTMLConverter(BaseConverter):
 
         align_style = ""
         if rt.alignment and rt.alignment != "left":
-            align_style = f' style="text-align: {html.escape(rt.alignment)}"'
+            align_style = f' style="text-align: {_escape(rt.alignment)}"'
 
         if rt.list_type:
             tag = "ol" if rt.list_type == "ordered" else "ul"
-            prefix = f"<{tag}>" + "<li><ul>" * rt.indent_level
-            suffix = "</ul></li>" * rt.indent_level + f"</{tag}>"
+            prefix, suffix = _html_list_wrapper(tag, rt.indent_level)
             return f"{prefix}<li>{inline}</li>{suffix}"
 
         if rt.indent_level > 0:
-            prefix = "<ul>" * rt.indent_level
-            suffix = "</ul>" * rt.indent_level
+            prefix, suffix = _html_indent_wrapper(rt.indent_level)
             return f"{prefix}<li>{inline}</li>{suffix}"
 
         return f"<p{align_style}>{inline}</p>"
 
     def _render_image(self, img: ImageElement) -> str:
         """Render image reference in HTML."""
-        alt = html.escape(img.alt_text or img.filename or "image")
-        if img.data:
+        alt = _escape(img.alt_text or img.filename or "image")
+        if img.has_data:
             filename = _sanitize_filename(
                 img.filename or f"image.{img.format or 'bin'}"
             )
-            escaped_filename = html.escape(filename, quote=True)
+            escaped_filename = _escape(filename)
             return f'<img src="./images/{escaped_filename}" alt="{alt}">'
-        escaped_name = html.escape(img.filename or "image", quote=True)
+        escaped_name = _escape(img.filename or "image")
         return f'<img src="{escaped_name}" alt="{alt}">'
 
     def _render_table(self, table: TableElement) -> str:
@@ -184,17 +244,15 @@ class HTMLConverter(BaseConverter):
         if not table.rows:
             return ""
 
+        render = self._render_element
         lines: list[str] = ["<table>"]
 
         for i, row in enumerate(table.rows):
             lines.append("<tr>")
             cell_tag = "th" if i == 0 else "td"
             for cell_elements in row:
-                cell_html = " ".join(
-                    self._render_element(e)
-                    for e in cell_elements
-                    if self._render_element(e)
-                )
+                rendered = [render(e) for e in cell_elements]
+                cell_html = " ".join([r for r in rendered if r])
                 lines.append(f"<{cell_tag}>{cell_html}</{cell_tag}>")
             lines.append("</tr>")
 
@@ -203,9 +261,9 @@ class HTMLConverter(BaseConverter):
 
     def _render_embedded_file(self, ef: EmbeddedFile) -> str:
         """Render embedded file reference in HTML."""
-        name = html.escape(ef.filename or "attachment")
-        if ef.data:
+        name = _escape(ef.filename or "attachment")
+        if ef.has_data:
             filename = _sanitize_filename(ef.filename or "attachment")
-            escaped_filename = html.escape(filename, quote=True)
+            escaped_filename = _escape(filename)
             return f'<a href="./attachments/{escaped_filename}">{name}</a>'
         return f"<span>{name}</span>"
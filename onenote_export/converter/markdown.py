@@ -4,7 +4,16 @@ Converts Page objects with ContentElements into Markdown text.
 File I/O is handled by the BaseConverter superclass.
 """
 
-from onenote_export.converter.base import BaseConverter, _sanitize_filename
+import io
+from collections.abc import Callable
+from pathlib import Path
+
+from onenote_export.converter.base import (
+    BaseConverter,
+    _OrderedListCounter,
+    _sanitize_filename,
+    _wrapper_table,
+)
 from onenote_export.model.content import (
     ContentElement,
     EmbeddedFile,
@@ -14,62 +23,73 @@ from onenote_export.model.content import (
 )
 from onenote_export.model.page import Page
 
+# Inline formatting wrappers indexed by a run's flag bits:
+# strikethrough, bold, italic, underline, superscript, subscript.
+_MD_WRAPPERS = _wrapper_table(
+    (
+        ("~~", "~~"),
+        ("**", "**"),
+        ("*", "*"),
+        ("*", "*"),
+        ("<sup>", "</sup>"),
+        ("<sub>", "</sub>"),
+    )
+)
+
 
 class MarkdownConverter(BaseConverter):
     """Converts OneNote content model to Markdown files."""
 
     FILE_EXTENSION = ".md"
 
+    def __init__(self, output_dir: str | Path) -> None:
+        super().__init__(output_dir)
+        self._dispatch: dict[type[ContentElement], Callable[..., str]] = {
+            RichText: self._render_rich_text,
+            ImageElement: self._render_image,
+            TableElement: self._render_table,
+            EmbeddedFile: self._render_embedded_file,
+        }
+
     def render_page(self, page: Page) -> str:
         """Render a single page to Markdown text."""
-        lines: list[str] = []
+        # Blocks are separated by a blank line; each write is prefixed
+        # with "\n" once something precedes it.
+        buf = io.StringIO()
 
         if page.title:
-            lines.append(f"# {page.title}")
-            lines.append("")
+            buf.write(f"# {page.title}\n")
 
-        ordered_counters: dict[int, int] = {}
+        ordered_counter = _OrderedListCounter()
 
         for element in page.elements:
             if isinstance(element, RichText) and element.list_type == "ordered":
-                level = element.indent_level
-                if level not in ordered_counters:
-                    ordered_counters[level] = 0
-                for k in list(ordered_counters):
-                    if k > level:
-                        del ordered_counters[k]
-                ordered_counters[level] += 1
                 md = self._render_rich_text(
                     element,
-                    ordered_number=ordered_counters[level],
+                    ordered_number=ordered_counter.next(element.indent_level),
                 )
             else:
                 if not (isinstance(element, RichText) and element.list_type):
-                    ordered_counters.clear()
+                    ordered_counter.reset()
                 md = self._render_element(element)
 
             if md:
-                lines.append(md)
-                lines.append("")
+                if buf.tell():
+                    buf.write("\n")
+                buf.write(md)
+                buf.write("\n")
 
         if page.author:
-            lines.append("---")
-            lines.append(f"*Author: {page.author}*")
-            lines.append("")
+            if buf.tell():
+                buf.write("\n")
+            buf.write(f"---\n*Author: {page.author}*\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _render_element(self, element: ContentElement) -> str:
         """Render a single content element to Markdown."""
-        if isinstance(element, RichText):
-            return self._render_rich_text(element)
-        elif isinstance(element, ImageElement):
-            return self._render_image(element)
-        elif isinstance(element, TableElement):
-            return self._render_table(element)
-        elif isinstance(element, EmbeddedFile):
-            return self._render_embedded_file(element)
-        return ""
+        handler = self._dispatch.get(type(element))
+        return handler(element) if handler else ""
 
     def _render_rich_text(
         self,
@@ -77,6 +97,13 @@ class MarkdownConverter(BaseConverter):
         ordered_number: int = 0,
     ) -> str:
         """Render rich text to Markdown."""
+        if (
+            not rt.heading_level
+            and not rt.list_type
+            and not any(run.text for run in rt.runs)
+        ):
+            return ""
+
         parts: list[str] = []
 
         for run in rt.runs:
@@ -84,26 +111,28 @@ class MarkdownConverter(BaseConverter):
             if not text:
                 continue
 
-            if not rt.heading_level:
-                if run.strikethrough:
-                    text = f"~~{text}~~"
-                if run.bold and run.italic:
-                    text = f"***{text}***"
-                elif run.bold:
-                    text = f"**{text}**"
-                elif run.italic:
-                    text = f"*{text}*"
-                if run.underline and not run.hyperlink_url:
-                    text = f"*{text}*"
-
             if run.hyperlink_url:
-                text = f"[{run.text}]({run.hyperlink_url})"
+                # A link replaces any inline emphasis; only the script
+                # wrappers still apply on top of it.
+                text = f"[{text}]({run.hyperlink_url})"
+                flags = 0
+                if not rt.heading_level:
+                    flags = run.superscript << 4 | run.subscript << 5
+            elif rt.heading_level:
+                flags = 0
+            else:
+                flags = (
+                    run.strikethrough
+                    | run.bold << 1
+                    | run.italic << 2
+                    | run.underline << 3
+                    | run.superscript << 4
+                    | run.subscript << 5
+                )
 
-            if not rt.heading_level:
-                if run.superscript:
-                    text = f"<sup>{text}</sup>"
-                if run.subscript:
-                    text = f"<sub>{text}</sub>"
+            if flags:
+                prefix, suffix = _MD_WRAPPERS[flags]
+                text = f"{prefix}{text}{suffix}"
 
             parts.append(text)
 
@@ -129,7 +158,7 @@ class MarkdownConverter(BaseConverter):
     def _render_image(self, img: ImageElement) -> str:
         """Render image reference in Markdown."""
         alt = img.alt_text or img.filename or "image"
-        if img.data:
+        if img.has_data:
             filename = _sanitize_filename(
                 img.filename or f"image.{img.format or 'bin'}"
             )
@@ -141,16 +170,14 @@ class MarkdownConverter(BaseConverter):
         if not table.rows:
             return ""
 
+        render = self._render_element
         lines: list[str] = []
 
         for i, row in enumerate(table.rows):
             cells = []
             for cell_elements in row:
-                cell_text = " ".join(
-                    self._render_element(e).strip()
-                    for e in cell_elements
-                    if self._render_element(e).strip()
-                )
+                rendered = [render(e).strip() for e in cell_elements]
+                cell_text = " ".join([r for r in rendered if r])
                 cells.append(cell_text or " ")
 
             lines.append("| " + " | ".join(cells) + " |")
@@ -163,7 +190,7 @@ class MarkdownConverter(BaseConverter):
     def _render_embedded_file(self, ef: EmbeddedFile) -> str:
         """Render embedded file reference in Markdown."""
         name = ef.filename or "attachment"
-        if ef.data:
+        if ef.has_data:
             filename = _sanitize_filename(name)
             return f"[{name}](./attachments/{filename})"
         return f"[{name}]"
@@ -1,6 +1,8 @@
 """Content elements that make up a OneNote page."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import BinaryIO
 
 
 @dataclass(frozen=True)
@@ -48,6 +50,15 @@ class ImageElement(ContentElement):
     width: int = 0
     height: int = 0
     format: str = ""  # "png", "jpeg", "gif", "bmp"
+    # Optional opener for large payloads; preferred over ``data`` when set.
+    data_stream: Callable[[], BinaryIO] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def has_data(self) -> bool:
+        """Whether there is image content to write to disk."""
+        return bool(self.data) or self.data_stream is not None
 
 
 @dataclass
@@ -66,3 +77,12 @@ class EmbeddedFile(ContentElement):
     data: bytes = b""
     filename: str = ""
     source_path: str = ""
+    # Optional opener for large payloads; preferred over ``data`` when set.
+    data_stream: Callable[[], BinaryIO] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def has_data(self) -> bool:
+        """Whether there is file content to write to disk."""
+        return bool(self.data) or self.data_stream is not None
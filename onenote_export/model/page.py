@@ -1,8 +1,9 @@
 """Page model representing a single OneNote page."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
-from onenote_export.model.content import ContentElement
+from onenote_export.model.content import ContentElement, EmbeddedFile, ImageElement
 
 
 @dataclass
@@ -15,3 +16,13 @@ class Page:
     last_modified_time: int = 0
     author: str = ""
     elements: list[ContentElement] = field(default_factory=list)
+
+    @cached_property
+    def images(self) -> list[ImageElement]:
+        """Image elements on this page, in document order."""
+        return [e for e in self.elements if isinstance(e, ImageElement)]
+
+    @cached_property
+    def embedded_files(self) -> list[EmbeddedFile]:
+        """Embedded file elements on this page, in document order."""
+        return [e for e in self.elements if isinstance(e, EmbeddedFile)]
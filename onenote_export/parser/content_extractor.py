@@ -5,8 +5,11 @@ content model (Section with Pages and ContentElements).
 """
 
 import ast
+import binascii
 import logging
 import re
+import struct
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -42,6 +45,10 @@ _STYLE_CONTAINER = "jcidPersistablePropertyContainerForTOCSection"
 
 # Structural types that delimit content groups in the flat object list.
 _STRUCTURAL_TYPES = frozenset({_OUTLINE_ELEMENT, _OUTLINE_NODE})
+# Leaf content types that can be orphaned ahead of their outline.
+_LEAF_CONTENT_TYPES = frozenset({_RICH_TEXT, _IMAGE_NODE, _EMBEDDED_FILE})
+# Table row/cell nodes, which end a cell's inline content run.
+_TABLE_PART_TYPES = frozenset({_TABLE_ROW, _TABLE_CELL})
 
 # ParagraphStyleId → heading level mapping
 _HEADING_STYLE_MAP: dict[str, int] = {
@@ -53,6 +60,36 @@ _HEADING_STYLE_MAP: dict[str, int] = {
     "h6": 6,
 }
 
+# ' (On M-D-YY)' / ' (On M-D-YY - N)' version suffix on section filenames.
+_DATE_TAG_RE = re.compile(r"\s*\(On\s+\d+-\d+-\d+(?:\s*-\s*\d+)?\)")
+# Trailing '.one' left over from 'Name.one (On date).one' filenames.
+_ONE_EXT_RE = re.compile(r"\.one$", re.IGNORECASE)
+# First run of digits in a string-valued numeric property.
+_DIGITS_RE = re.compile(r"\d+")
+
+# Hex digit bytes, for detecting hex-encoded TextExtendedAscii values.
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+# Little-endian unsigned readers keyed by byte width; unpack_from reads
+# in place instead of slicing a new bytes object per property.
+_UNPACK_LE = {
+    2: struct.Struct("<H").unpack_from,
+    4: struct.Struct("<I").unpack_from,
+}
+
+# Lowercase string spellings accepted as True by _as_bool.
+_TRUTHY_STRINGS = frozenset({"true", "1", "yes"})
+
+# Leading magic bytes -> image format, checked in order by
+# _detect_image_format (WebP needs a second check at offset 8).
+_IMAGE_MAGICS: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"BM", "bmp"),
+)
+
 # HYPERLINK field code pattern: OneNote collapsible sections embed
 # hyperlinks as RTF-style field codes with U+FDDF or U+FDF3 marker.
 # Format: <marker>HYPERLINK "url"display_text
@@ -78,62 +115,41 @@ def _deduplicate_objects(
     if len(objects) < 4:
         return objects
 
-    # Build a fingerprint sequence for content-bearing objects
-    fingerprints: list[str] = []
-    for obj in objects:
-        fp = _object_fingerprint(obj)
-        fingerprints.append(fp)
-
-    # Find the repeat pattern: look for the first content fingerprint
-    # appearing again later in the sequence
-    content_fps = [
-        (i, fp)
-        for i, fp in enumerate(fingerprints)
-        if fp and objects[i].obj_type in (_RICH_TEXT, _IMAGE_NODE, _EMBEDDED_FILE)
-    ]
-
-    if len(content_fps) < 2:
-        return objects
-
-    # Find where the first content element repeats
-    first_fp = content_fps[0][1]
-    repeat_idx = None
-
-    for i, fp in content_fps[1:]:
-        if fp == first_fp:
-            repeat_idx = i
-            break
-
-    if repeat_idx is None:
-        return objects
-
-    # Take objects up to the repeat point, plus any non-content objects
-    # (styles, outline elements) that follow
+    # Single pass: keep the first occurrence of each content fingerprint
+    # (non-content objects such as styles and outlines always pass), and
+    # note whether the first content element repeats.  The deduplicated
+    # list is only used when it does, i.e. revision copies are present.
     result: list[ExtractedObject] = []
-    seen_content: set[str] = set()
+    seen_content: set[tuple[str, ...]] = set()
+    first_fp: tuple[str, ...] | None = None
+    repeated = False
 
-    for i, obj in enumerate(objects):
-        fp = fingerprints[i]
-
-        # Non-content objects (styles, outlines) - always include
-        if not fp:
+    for obj in objects:
+        fp = _object_fingerprint(obj)
+        if fp is None:
             result.append(obj)
             continue
 
-        # Content object - include only the first occurrence
+        if first_fp is None:
+            first_fp = fp
+        elif fp == first_fp:
+            repeated = True
+
         if fp not in seen_content:
             seen_content.add(fp)
             result.append(obj)
 
-    return result
+    return result if repeated else objects
 
 
-def _object_fingerprint(obj: ExtractedObject) -> str:
+def _object_fingerprint(obj: ExtractedObject) -> tuple[str, ...] | None:
     """Create a content-based fingerprint for deduplication.
 
     Normalises text by decoding from both Unicode and ASCII property
     fields so that different encoding representations of the same
-    content produce the same fingerprint.
+    content produce the same fingerprint.  Fingerprints are plain
+    tuples so they hash without formatting a new string; ``None`` means
+    the object carries no content to compare.
     """
     if obj.obj_type == _RICH_TEXT:
         raw_unicode = obj.properties.get("RichEditTextUnicode", "")
@@ -144,15 +160,15 @@ def _object_fingerprint(obj: ExtractedObject) -> str:
             decoded = _decode_text_value(raw_ascii, encoding="ascii")
         else:
             decoded = ""
-        return f"text:{decoded}" if decoded.strip() else ""
+        return ("text", decoded) if decoded.strip() else None
     elif obj.obj_type == _IMAGE_NODE:
         filename = str(obj.properties.get("ImageFilename", ""))
         alt = str(obj.properties.get("ImageAltText", ""))
-        return f"img:{filename}:{alt}" if (filename or alt) else ""
+        return ("img", filename, alt) if (filename or alt) else None
     elif obj.obj_type == _EMBEDDED_FILE:
         name = str(obj.properties.get("EmbeddedFileName", ""))
-        return f"file:{name}" if name else ""
-    return ""
+        return ("file", name) if name else None
+    return None
 
 
 def _reorder_by_outline_hierarchy(
@@ -191,7 +207,7 @@ def _reorder_by_outline_hierarchy(
     for obj in objects:
         if obj.obj_type in _STRUCTURAL_TYPES:
             break
-        if obj.obj_type in (_RICH_TEXT, _IMAGE_NODE, _EMBEDDED_FILE):
+        if obj.obj_type in _LEAF_CONTENT_TYPES:
             pre.append(obj)
     orphans = tuple(pre)
 
@@ -423,12 +439,12 @@ _NUMBERED_MSAA_LEVEL: dict[int, int] = {36: 1, 53: 2, 45: 3}
 
 def _build_list_node_map(
     objects: list[ExtractedObject],
-) -> dict[str, dict[str, object]]:
+) -> dict[str, Mapping[str, object]]:
     """Build a mapping from NumberListNode identity to its properties."""
-    result: dict[str, dict[str, object]] = {}
+    result: dict[str, Mapping[str, object]] = {}
     for obj in objects:
         if obj.obj_type == _NUMBER_LIST:
-            result[obj.identity] = dict(obj.properties)
+            result[obj.identity] = obj.properties
     return result
 
 
@@ -457,7 +473,7 @@ def _build_top_level_oe_ids(
 
 def _resolve_list_info(
     oe_obj: ExtractedObject,
-    list_node_map: dict[str, dict[str, object]],
+    list_node_map: dict[str, Mapping[str, object]],
     top_level_oe_ids: set[str],
 ) -> _ListInfo | None:
     """Resolve list type and indent level for an OutlineElement.
@@ -510,6 +526,101 @@ def _resolve_list_info(
     return _ListInfo(list_type=list_type, indent_level=indent_level)
 
 
+@dataclass
+class _PageContext:
+    """Mutable state threaded through the per-object handlers of _build_page."""
+
+    page: Page
+    objects: list[ExtractedObject]
+    file_data: dict[str, bytes]
+    paragraph_styles: dict[str, str] | None
+    list_node_map: dict[str, Mapping[str, object]]
+    top_level_oe_ids: set[str]
+    current_style: Mapping[str, object]
+    list_info: _ListInfo | None = None
+    list_info_used: bool = False  # True once a non-empty RT used list_info
+
+    def add(self, element: ContentElement | None) -> None:
+        """Append a non-empty element and mark the active list item used."""
+        if element:
+            self.page.elements.append(element)
+            if self.list_info is not None:
+                self.list_info_used = True
+
+
+# Each handler processes the object at index i and returns the number of
+# objects it consumed.  Types without a handler (NumberListNode, stray
+# table row/cell nodes, structural nodes) are skipped by _build_page.
+
+
+def _handle_style(ctx: _PageContext, obj: ExtractedObject, i: int) -> int:
+    ctx.current_style = obj.properties
+    return 1
+
+
+def _handle_outline_element(ctx: _PageContext, obj: ExtractedObject, i: int) -> int:
+    resolved = _resolve_list_info(
+        obj,
+        ctx.list_node_map,
+        ctx.top_level_oe_ids,
+    )
+    if resolved is not None:
+        # OE has its own list marker — always use it.
+        ctx.list_info = resolved
+        ctx.list_info_used = False
+    elif ctx.list_info_used:
+        # Previous list_info already produced content.
+        # This non-list OE is NOT a wrapper — reset.
+        ctx.list_info = None
+    # Otherwise: list_info carries forward (wrapper OE for
+    # a recently-edited list item whose text is here).
+    return 1
+
+
+def _handle_rich_text(ctx: _PageContext, obj: ExtractedObject, i: int) -> int:
+    ctx.add(
+        _extract_rich_text(
+            obj,
+            ctx.current_style,
+            ctx.list_info,
+            ctx.paragraph_styles,
+        )
+    )
+    return 1
+
+
+def _handle_image(ctx: _PageContext, obj: ExtractedObject, i: int) -> int:
+    ctx.add(_extract_image(obj, ctx.file_data))
+    return 1
+
+
+def _handle_table(ctx: _PageContext, obj: ExtractedObject, i: int) -> int:
+    element, consumed, _out_of_line = _extract_table(
+        obj,
+        ctx.objects,
+        i,
+        ctx.current_style,
+        ctx.file_data,
+    )
+    ctx.add(element)
+    return 1 + consumed
+
+
+def _handle_embedded_file(ctx: _PageContext, obj: ExtractedObject, i: int) -> int:
+    ctx.add(_extract_embedded_file(obj, ctx.file_data))
+    return 1
+
+
+_OBJECT_HANDLERS: dict[str, Callable[[_PageContext, ExtractedObject, int], int]] = {
+    _STYLE_CONTAINER: _handle_style,
+    _OUTLINE_ELEMENT: _handle_outline_element,
+    _RICH_TEXT: _handle_rich_text,
+    _IMAGE_NODE: _handle_image,
+    _TABLE_NODE: _handle_table,
+    _EMBEDDED_FILE: _handle_embedded_file,
+}
+
+
 def _build_page(
     extracted: ExtractedPage,
     file_data: dict[str, bytes],
@@ -537,106 +648,29 @@ def _build_page(
     skip_indices = _find_out_of_line_table_refs(deduped_objects)
 
     # Pre-scan: build list resolution data structures.
-    list_node_map = _build_list_node_map(deduped_objects)
-    top_level_oe_ids = _build_top_level_oe_ids(deduped_objects)
+    ctx = _PageContext(
+        page=page,
+        objects=deduped_objects,
+        file_data=file_data,
+        paragraph_styles=paragraph_styles,
+        list_node_map=_build_list_node_map(deduped_objects),
+        top_level_oe_ids=_build_top_level_oe_ids(deduped_objects),
+        current_style={},
+    )
 
-    # Process objects in order, building content elements.
+    # Process objects in order, dispatching on object type.
     # Use index-based iteration so table processing can consume
     # subsequent row/cell/content objects.
-    current_style: dict[str, object] = {}
-    list_info: _ListInfo | None = None
-    list_info_used = False  # True once a non-empty RT used list_info
+    handlers = _OBJECT_HANDLERS
+    n = len(deduped_objects)
     i = 0
-
-    while i < len(deduped_objects):
+    while i < n:
         if i in skip_indices:
             i += 1
             continue
-
         obj = deduped_objects[i]
-
-        if obj.obj_type == _STYLE_CONTAINER:
-            current_style = dict(obj.properties)
-            i += 1
-            continue
-
-        if obj.obj_type == _NUMBER_LIST:
-            i += 1
-            continue
-
-        if obj.obj_type == _OUTLINE_ELEMENT:
-            resolved = _resolve_list_info(
-                obj,
-                list_node_map,
-                top_level_oe_ids,
-            )
-            if resolved is not None:
-                # OE has its own list marker — always use it.
-                list_info = resolved
-                list_info_used = False
-            elif list_info_used:
-                # Previous list_info already produced content.
-                # This non-list OE is NOT a wrapper — reset.
-                list_info = None
-            # Otherwise: list_info carries forward (wrapper OE for
-            # a recently-edited list item whose text is here).
-            i += 1
-            continue
-
-        if obj.obj_type == _RICH_TEXT:
-            element = _extract_rich_text(
-                obj,
-                current_style,
-                list_info,
-                paragraph_styles,
-            )
-            if element:
-                page.elements.append(element)
-                if list_info is not None:
-                    list_info_used = True
-            i += 1
-            continue
-
-        if obj.obj_type == _IMAGE_NODE:
-            element = _extract_image(obj, file_data)
-            if element:
-                page.elements.append(element)
-                if list_info is not None:
-                    list_info_used = True
-            i += 1
-            continue
-
-        if obj.obj_type == _TABLE_NODE:
-            element, consumed, _out_of_line = _extract_table(
-                obj,
-                deduped_objects,
-                i,
-                current_style,
-                file_data,
-            )
-            if element:
-                page.elements.append(element)
-                if list_info is not None:
-                    list_info_used = True
-            i += 1 + consumed
-            continue
-
-        if obj.obj_type == _EMBEDDED_FILE:
-            element = _extract_embedded_file(obj, file_data)
-            if element:
-                page.elements.append(element)
-                if list_info is not None:
-                    list_info_used = True
-            i += 1
-            continue
-
-        # Skip table row/cell nodes that weren't consumed by a table
-        # (shouldn't happen, but be defensive)
-        if obj.obj_type in (_TABLE_ROW, _TABLE_CELL):
-            i += 1
-            continue
-
-        i += 1
+        handler = handlers.get(obj.obj_type)
+        i += handler(ctx, obj, i) if handler is not None else 1
 
     page.elements = _dedup_elements(page.elements)
     return page
@@ -665,7 +699,7 @@ def _dedup_elements(elements: list[ContentElement]) -> list[ContentElement]:
 
 def _extract_rich_text(
     obj: ExtractedObject,
-    style: dict[str, object],
+    style: Mapping[str, object],
     list_info: _ListInfo | None,
     paragraph_styles: dict[str, str] | None = None,
 ) -> RichText | None:
@@ -756,7 +790,7 @@ def _extract_rich_text(
 
 
 def _resolve_heading_level(
-    props: dict[str, object],
+    props: Mapping[str, object],
     paragraph_styles: dict[str, str] | None,
 ) -> int:
     """Resolve the heading level from a RichTextOENode's ParagraphStyle.
@@ -801,9 +835,8 @@ def _extract_image(
         # PictureContainer is a list of identity strings referencing
         # the file data store.  Look up by identity first.
         for ref in pic_container:
-            ref_str = str(ref)
-            if ref_str in file_data:
-                data = file_data[ref_str]
+            data = file_data.get(str(ref), b"")
+            if data:
                 break
 
     if not data and not filename:
@@ -825,7 +858,7 @@ def _extract_table(
     obj: ExtractedObject,
     objects: list[ExtractedObject],
     table_idx: int,
-    style: dict[str, object],
+    style: Mapping[str, object],
     file_data: dict[str, bytes],
 ) -> tuple[TableElement | None, int, set[int]]:
     """Extract table with rows and cell content from a TableNode.
@@ -900,7 +933,7 @@ def _extract_table(
             outlines_seen = 0
             while i < len(objects):
                 inner = objects[i]
-                if inner.obj_type in (_TABLE_CELL, _TABLE_ROW):
+                if inner.obj_type in _TABLE_PART_TYPES:
                     break
 
                 if inner.obj_type == _OUTLINE_ELEMENT:
@@ -1009,19 +1042,23 @@ def _decode_text_value(value: object, encoding: str = "unicode") -> str:
         if not cleaned:
             return ""
 
-        # Check if it's a hex string (common for TextExtendedAscii)
-        if all(c in "0123456789abcdefABCDEF" for c in cleaned):
+        # Non-ASCII Unicode text can't be hex-encoded and the garbled-text
+        # repair only applies to the ASCII property, so it just needs cleaning.
+        if encoding == "unicode" and not cleaned.isascii():
+            return _clean_text(cleaned)
+
+        # Check if it's a hex string (common for TextExtendedAscii).
+        # Deleting every hex digit leaves nothing only for pure hex input.
+        if cleaned.isascii() and not cleaned.encode("ascii").translate(
+            None, _HEX_DIGITS
+        ):
             try:
-                raw = bytes.fromhex(cleaned)
+                raw = binascii.unhexlify(cleaned)
                 if encoding == "ascii":
-                    return _clean_text(
-                        raw.decode("ascii", errors="replace").rstrip("\x00")
-                    )
+                    return _clean_text(raw.decode("ascii", errors="replace"))
                 else:
-                    return _clean_text(
-                        raw.decode("utf-16-le", errors="replace").rstrip("\x00")
-                    )
-            except (ValueError, UnicodeDecodeError):
+                    return _clean_text(raw.decode("utf-16-le", errors="replace"))
+            except (ValueError, binascii.Error):
                 pass
 
         # Check for garbled text: pyOneNote sometimes decodes ASCII bytes
@@ -1031,7 +1068,7 @@ def _decode_text_value(value: object, encoding: str = "unicode") -> str:
         if encoding == "ascii" and _looks_garbled(cleaned):
             try:
                 raw = cleaned.encode("utf-16-le")
-                return _clean_text(raw.decode("ascii", errors="replace").rstrip("\x00"))
+                return _clean_text(raw.decode("ascii", errors="replace"))
             except (UnicodeEncodeError, UnicodeDecodeError):
                 pass
 
@@ -1039,11 +1076,11 @@ def _decode_text_value(value: object, encoding: str = "unicode") -> str:
 
     if isinstance(value, bytes):
         if encoding == "ascii":
-            return _clean_text(value.decode("ascii", errors="replace").rstrip("\x00"))
+            return _clean_text(value.decode("ascii", errors="replace"))
         try:
-            return _clean_text(value.decode("utf-16-le").rstrip("\x00"))
+            return _clean_text(value.decode("utf-16-le"))
         except UnicodeDecodeError:
-            return _clean_text(value.decode("latin-1").rstrip("\x00"))
+            return _clean_text(value.decode("latin-1"))
 
     return _clean_text(str(value)) if value else ""
 
@@ -1055,12 +1092,15 @@ def _looks_garbled(text: str) -> bool:
     UTF-16 strings instead of ASCII. The result contains CJK characters,
     unusual symbols, and zero-width spaces for normal English text.
     """
-    if not text:
+    # str.isascii() is a constant-time flag check in CPython, so plain
+    # ASCII text (the common case) skips the encode below entirely.
+    if len(text) <= 2 or text.isascii():
         return False
-    # Count characters outside normal ASCII+extended range
-    non_ascii = sum(1 for c in text if ord(c) > 0xFF)
+    # Count characters outside normal ASCII+extended range: the Latin-1
+    # encoder drops exactly those, in a single C-level pass.
+    non_ascii = len(text) - len(text.encode("latin-1", errors="ignore"))
     # If more than 30% of characters are non-ASCII, it's likely garbled
-    return len(text) > 2 and non_ascii / len(text) > 0.3
+    return non_ascii / len(text) > 0.3
 
 
 def _parse_hyperlink_field_codes(text: str) -> list[tuple[str, str]]:
@@ -1112,39 +1152,57 @@ def _parse_hyperlink_field_codes(text: str) -> list[tuple[str, str]]:
 def _section_name_from_path(file_path: str) -> str:
     """Extract a clean section name from a file path."""
     name = Path(file_path).stem
-    name = re.sub(r"\s*\(On\s+\d+-\d+-\d+(?:\s*-\s*\d+)?\)", "", name)
-    name = re.sub(r"\.one$", "", name, flags=re.IGNORECASE)
+    name = _DATE_TAG_RE.sub("", name)
+    name = _ONE_EXT_RE.sub("", name)
     return name.strip() or "Untitled"
 
 
 def _clean_text(text: str) -> str:
-    """Clean text by removing null bytes, control characters, and replacement chars."""
+    """Clean text by removing null bytes, control characters, and replacement chars.
+
+    Null bytes anywhere (including trailing UTF-16 padding) are removed
+    here, so callers need not ``rstrip("\\x00")`` first.
+    """
+    # Fast path for the common case: plain ASCII with nothing to remove.
+    # str.replace copies even when there is no match, so test first.
+    if text.isascii() and "\x00" not in text and "\x0b" not in text:
+        return text.strip()
     # Remove null bytes and vertical tabs (common OneNote artifacts)
     text = text.replace("\x00", "").replace("\x0b", "")
-    # Replace narrow no-break space (U+202F) with regular space
-    text = text.replace("\u202f", " ")
-    # Remove Unicode replacement character (U+FFFD)
-    text = text.replace("\ufffd", "")
+    # The remaining artifacts are non-ASCII; str.isascii() is O(1).
+    if not text.isascii():
+        # Replace narrow no-break space (U+202F) with regular space
+        text = text.replace("\u202f", " ")
+        # Remove Unicode replacement character (U+FFFD)
+        text = text.replace("\ufffd", "")
     return text.strip()
 
 
 def _as_bool(value: object) -> bool:
     """Convert a property value to bool."""
-    if isinstance(value, bool):
+    # bool cannot be subclassed, so an identity check is exact (and cheaper
+    # than isinstance); pyOneNote style flags are almost always bools.
+    if value.__class__ is bool:
         return value
     if isinstance(value, str):
-        return value.lower() in ("true", "1", "yes")
+        return value in _TRUTHY_STRINGS or value.lower() in _TRUTHY_STRINGS
     return bool(value)
 
 
-def _parse_int_prop(value: object) -> int:
-    """Parse an integer property."""
+def _parse_int_prop(value: object, width: int = 4) -> int:
+    """Parse an integer property.
+
+    ``bytes`` values are little-endian and read up to *width* bytes; a
+    shorter value needs no padding since the high bytes are zero.
+    """
     if isinstance(value, int):
         return value
-    if isinstance(value, bytes) and len(value) >= 2:
-        return int.from_bytes(value[:4].ljust(4, b"\x00"), "little")
+    if isinstance(value, bytes):
+        if len(value) >= width:
+            return _UNPACK_LE[width](value)[0]
+        return int.from_bytes(value, "little")
     if isinstance(value, str):
-        match = re.search(r"\d+", value)
+        match = _DIGITS_RE.search(value)
         if match:
             return int(match.group())
     return 0
@@ -1159,44 +1217,31 @@ def _parse_byte_prop_as_int(value: object) -> int:
     if isinstance(value, int):
         return value
     if isinstance(value, bytes) and len(value) >= 2:
-        return int.from_bytes(value[:2], "little")
+        return _UNPACK_LE[2](value)[0]
     if isinstance(value, str):
         # Try to recover bytes from repr string like "b'$\x00'"
         if value.startswith("b'") or value.startswith('b"'):
             try:
                 raw = ast.literal_eval(value)
                 if isinstance(raw, bytes) and len(raw) >= 2:
-                    return int.from_bytes(raw[:2], "little")
+                    return _UNPACK_LE[2](raw)[0]
             except (ValueError, SyntaxError):
                 pass
     return 0
 
 
 def _parse_font_size(value: object) -> int:
-    """Parse font size from pyOneNote format."""
-    if isinstance(value, int):
-        return value
-    if isinstance(value, bytes):
-        return int.from_bytes(value[:2].ljust(2, b"\x00"), "little")
-    if isinstance(value, str):
-        match = re.search(r"\d+", value)
-        if match:
-            return int(match.group())
-    return 0
+    """Parse font size from pyOneNote format (a 2-byte value)."""
+    return _parse_int_prop(value, width=2)
 
 
 def _detect_image_format(data: bytes) -> str:
     """Detect image format from magic bytes."""
-    if not data or len(data) < 4:
+    if len(data) < 4:
         return ""
-    if data[:8] == b"\x89PNG\r\n\x1a\n":
-        return "png"
-    if data[:3] == b"\xff\xd8\xff":
-        return "jpeg"
-    if data[:6] in (b"GIF87a", b"GIF89a"):
-        return "gif"
-    if data[:2] == b"BM":
-        return "bmp"
-    if data[:4] == b"RIFF" and len(data) > 8 and data[8:12] == b"WEBP":
+    for magic, fmt in _IMAGE_MAGICS:
+        if data.startswith(magic):
+            return fmt
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
         return "webp"
     return ""
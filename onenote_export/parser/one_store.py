@@ -4,9 +4,11 @@ Extracts structured content (text, images, formatting) from .one files
 and organizes it by page.
 """
 
+import functools
 import logging
 import re
 import struct
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -145,8 +147,30 @@ _NUMBER_LIST = "jcidNumberListNode"
 _STYLE_CONTAINER = "jcidPersistablePropertyContainerForTOCSection"
 _REVISION_META = "jcidRevisionMetaData"
 
-
-@dataclass
+# Object types that make up a page's renderable content.
+_PAGE_CONTENT_TYPES = frozenset(
+    {
+        _RICH_TEXT,
+        _IMAGE_NODE,
+        _TABLE_NODE,
+        _TABLE_ROW,
+        _TABLE_CELL,
+        _EMBEDDED_FILE,
+        _OUTLINE_ELEMENT,
+        _OUTLINE_NODE,
+        _NUMBER_LIST,
+    }
+)
+
+# GUID part of an ExtendedGUID identity: '<ExtendedGUID> (guid, n)'.
+_GUID_RE = re.compile(r"\(([^,]+),")
+# In-place little-endian uint32 reader for byte-valued properties.
+_UNPACK_U32 = struct.Struct("<I").unpack_from
+# First run of digits in a string-valued numeric property.
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@dataclass(slots=True)
 class ExtractedProperty:
     """A single property from a OneNote object."""
 
@@ -154,16 +178,16 @@ class ExtractedProperty:
     value: object  # str, bytes, int, bool, list, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedObject:
     """A parsed object from the OneNote file."""
 
     obj_type: str
     identity: str
-    properties: dict[str, object] = field(default_factory=dict)
+    properties: Mapping[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedPage:
     """A page with its title and content objects."""
 
@@ -175,7 +199,7 @@ class ExtractedPage:
     objects: list[ExtractedObject] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSection:
     """All pages extracted from a single .one file."""
 
@@ -221,13 +245,14 @@ class OneStoreParser:
         # Extract paragraph styles from ReadOnly object declarations
         section.paragraph_styles = self._extract_paragraph_styles(doc)
 
-        # Convert raw properties to ExtractedObjects
+        # Convert raw properties to ExtractedObjects.  The property dicts
+        # are only read downstream, so they are shared rather than copied.
         all_objects = []
         for raw in raw_props:
             obj = ExtractedObject(
                 obj_type=raw["type"],
                 identity=raw["identity"],
-                properties=dict(raw["val"]),
+                properties=raw["val"],
             )
             all_objects.append(obj)
 
@@ -311,83 +336,44 @@ class OneStoreParser:
         3. If a content GUID has no metadata, fall back to matching
            orphan metadata by title.
         """
-        pages: list[ExtractedPage] = []
-
-        # Classify every object by type, indexed by GUID
+        # Classify every object by type, indexed by GUID in a single pass.
+        # page_node_guids is an insertion-ordered set (dict keys).
         guid_objects: dict[str, list[ExtractedObject]] = {}
-        page_metas: list[ExtractedObject] = []
-        page_node_guids: list[str] = []
+        meta_by_guid: dict[str, ExtractedObject] = {}
+        page_node_guids: dict[str, None] = {}
 
         for obj in objects:
             guid = _extract_guid(obj.identity)
             guid_objects.setdefault(guid, []).append(obj)
 
             if obj.obj_type == _PAGE_META:
-                page_metas.append(obj)
+                # Later entries (newer revisions) overwrite earlier ones
+                meta_by_guid[guid] = obj
             elif obj.obj_type == _PAGE_NODE:
-                if guid not in page_node_guids:
-                    page_node_guids.append(guid)
+                page_node_guids[guid] = None
 
         # No page metadata at all — single unnamed page
-        if not page_metas:
-            all_content = [
-                o
-                for o in objects
-                if o.obj_type
-                in (
-                    _RICH_TEXT,
-                    _IMAGE_NODE,
-                    _TABLE_NODE,
-                    _TABLE_ROW,
-                    _TABLE_CELL,
-                    _EMBEDDED_FILE,
-                    _OUTLINE_ELEMENT,
-                    _OUTLINE_NODE,
-                    _NUMBER_LIST,
-                )
-            ]
-            if all_content:
-                pages.append(ExtractedPage(objects=all_content))
-            return pages
-
-        # Build a lookup: GUID -> page metadata
-        meta_by_guid: dict[str, ExtractedObject] = {}
-        for meta in page_metas:
-            guid = _extract_guid(meta.identity)
-            # Later entries (newer revisions) overwrite earlier ones
-            meta_by_guid[guid] = meta
+        if not meta_by_guid:
+            all_content = [o for o in objects if o.obj_type in _PAGE_CONTENT_TYPES]
+            return [ExtractedPage(objects=all_content)] if all_content else []
 
         # Orphan metas: metadata GUIDs with no page node (old revisions)
         orphan_metas: dict[str, ExtractedObject] = {
             g: m for g, m in meta_by_guid.items() if g not in page_node_guids
         }
 
-        # Content types we care about
-        _CONTENT_TYPES = {
-            _RICH_TEXT,
-            _IMAGE_NODE,
-            _TABLE_NODE,
-            _TABLE_ROW,
-            _TABLE_CELL,
-            _EMBEDDED_FILE,
-            _OUTLINE_ELEMENT,
-            _OUTLINE_NODE,
-            _NUMBER_LIST,
-        }
-
-        # Build one page per content GUID (GUID that has a PageNode)
-        seen_titles: dict[str, int] = {}
+        # Build one page per content GUID (GUID that has a PageNode),
+        # keeping the revision with the most content for each title.
+        # Replacing a dict value keeps the title's original position.
+        best_by_title: dict[str, ExtractedPage] = {}
         for content_guid in page_node_guids:
             objs = guid_objects.get(content_guid, [])
 
             # Find metadata — prefer same GUID, fall back to orphan
             meta = meta_by_guid.get(content_guid)
-            if not meta:
-                # Match orphan metadata by scanning (first available)
-                for og, om in list(orphan_metas.items()):
-                    meta = om
-                    del orphan_metas[og]
-                    break
+            if not meta and orphan_metas:
+                # Fall back to the first available orphan metadata
+                meta = orphan_metas.pop(next(iter(orphan_metas)))
 
             title = ""
             level = 0
@@ -407,7 +393,7 @@ class OneStoreParser:
                     break
 
             # Collect content objects for this GUID only
-            content = [o for o in objs if o.obj_type in _CONTENT_TYPES]
+            content = [o for o in objs if o.obj_type in _PAGE_CONTENT_TYPES]
 
             page = ExtractedPage(
                 title=title or "Untitled",
@@ -420,24 +406,22 @@ class OneStoreParser:
 
             # Deduplicate by title — keep the version with more content
             key = title.lower().strip()
-            if key in seen_titles:
-                idx = seen_titles[key]
-                if len(content) > len(pages[idx].objects):
-                    pages[idx] = page
-            else:
-                seen_titles[key] = len(pages)
-                pages.append(page)
+            prev = best_by_title.get(key)
+            if prev is None or len(content) > len(prev.objects):
+                best_by_title[key] = page
 
-        return pages
+        return list(best_by_title.values())
 
 
+@functools.lru_cache(maxsize=4096)
 def _extract_guid(identity_str: str) -> str:
     """Extract the GUID from an ExtendedGUID identity string.
 
     Input format: '<ExtendedGUID> (guid-string, n)'
-    Returns just the guid-string part.
+    Returns just the guid-string part.  Memoized because the same
+    identity strings recur across a section's page revisions.
     """
-    match = re.search(r"\(([^,]+),", identity_str)
+    match = _GUID_RE.search(identity_str)
     if match:
         return match.group(1).strip()
     return ""
@@ -445,8 +429,9 @@ def _extract_guid(identity_str: str) -> str:
 
 def _clean_text(text: str) -> str:
     """Clean up text by stripping null bytes and extra whitespace."""
-    text = text.replace("\x00", "").strip()
-    return text
+    if "\x00" not in text:
+        return text.strip()
+    return text.replace("\x00", "").strip()
 
 
 def _parse_int(value: object) -> int:
@@ -454,13 +439,12 @@ def _parse_int(value: object) -> int:
     if isinstance(value, int):
         return value
     if isinstance(value, bytes):
-        try:
-            return int.from_bytes(value[:4], "little")
-        except Exception:
-            return 0
+        if len(value) >= 4:
+            return _UNPACK_U32(value)[0]
+        return int.from_bytes(value, "little")
     if isinstance(value, str):
         # Try to extract numeric value
-        match = re.search(r"\d+", value)
+        match = _DIGITS_RE.search(value)
         if match:
             return int(match.group())
     return 0
@@ -3,6 +3,9 @@
 import re
 from pathlib import Path
 
+_DATE_TAG_RE = re.compile(r"\s*\(On\s+\d+-\d+-\d+(?:\s*-\s*\d+)?\)")
+_ONE_EXT_RE = re.compile(r"\.one$", re.IGNORECASE)
+
 
 def discover_one_files(input_dir: Path) -> list[Path]:
     """Recursively find all .one files in a directory.
@@ -28,10 +31,10 @@ def section_name_from_filename(filename: str) -> str:
     name = Path(filename).stem
 
     # Strip ' (On M-D-YY)' or ' (On M-D-YY - N)' suffix
-    name = re.sub(r"\s*\(On\s+\d+-\d+-\d+(?:\s*-\s*\d+)?\)", "", name)
+    name = _DATE_TAG_RE.sub("", name)
 
     # Strip trailing '.one' that appears in 'Name.one (On date)' pattern
-    name = re.sub(r"\.one$", "", name, flags=re.IGNORECASE)
+    name = _ONE_EXT_RE.sub("", name)
 
     return name.strip() or "Untitled"
 
@@ -0,0 +1,6 @@
+"""Filesystem locations of the test data shipped with the suite."""
+
+from pathlib import Path
+
+TEST_DATA = Path(__file__).parent / "test_data"
+NOTEBOOK_DIR = TEST_DATA / "Example-NoteBook-1"
@@ -0,0 +1,37 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from onenote_export.model.section import Section
+from onenote_export.parser.content_extractor import extract_section
+from onenote_export.parser.one_store import ExtractedSection, OneStoreParser
+from tests._paths import NOTEBOOK_DIR
+
+
+@pytest.fixture(scope="session")
+def notebook_dir() -> Path:
+    """Directory of the example notebook shipped with the tests."""
+    return NOTEBOOK_DIR
+
+
+@pytest.fixture(scope="session")
+def parsed_notebook(notebook_dir: Path) -> dict[Path, ExtractedSection]:
+    """Every example .one file, parsed once per session and keyed by path.
+
+    Parse results are treated as read-only by the extractor, so tests
+    can share them instead of re-reading the files from disk.
+    """
+    return {
+        path.resolve(): OneStoreParser(path).parse()
+        for path in sorted(notebook_dir.glob("*.one"))
+    }
+
+
+@pytest.fixture(scope="session")
+def extracted_notebook(
+    parsed_notebook: dict[Path, ExtractedSection],
+) -> dict[Path, Section]:
+    """Every example section run through extract_section once per session."""
+    return {path: extract_section(parsed) for path, parsed in parsed_notebook.items()}
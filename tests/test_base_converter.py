@@ -1,11 +1,19 @@
 """Tests for onenote_export.converter.base module."""
 
+import io
+import os
+import sys
 import tempfile
+import time
+
+import pytest
 
 from onenote_export.converter.base import (
     BaseConverter,
+    _OrderedListCounter,
     _page_filename,
     _sanitize_filename,
+    _wrapper_table,
 )
 from onenote_export.model.content import (
     EmbeddedFile,
@@ -80,6 +88,43 @@ class TestPageFilename:
         assert result.endswith(".md")
 
 
+class TestWrapperTable:
+    """Tests for _wrapper_table."""
+
+    def test_one_entry_per_flag_combination(self):
+        table = _wrapper_table((("<b>", "</b>"), ("<i>", "</i>")))
+        assert len(table) == 4
+        assert table[0] == ("", "")
+
+    def test_lower_bits_wrap_innermost(self):
+        table = _wrapper_table((("<b>", "</b>"), ("<i>", "</i>")))
+        assert table[0b01] == ("<b>", "</b>")
+        assert table[0b11] == ("<i><b>", "</b></i>")
+
+
+class TestOrderedListCounter:
+    """Tests for _OrderedListCounter."""
+
+    def test_shallower_item_resets_deeper_levels(self):
+        counter = _OrderedListCounter()
+        assert [counter.next(0), counter.next(1), counter.next(1)] == [1, 1, 2]
+        assert counter.next(0) == 2
+        assert counter.next(1) == 1
+
+    def test_reset_restarts_numbering(self):
+        counter = _OrderedListCounter()
+        counter.next(0)
+        counter.next(2)
+        counter.reset()
+        assert counter.next(0) == 1
+        assert counter.next(2) == 1
+
+    def test_levels_beyond_initial_capacity(self):
+        counter = _OrderedListCounter()
+        assert counter.next(40) == 1
+        assert counter.next(40) == 2
+
+
 class _StubConverter(BaseConverter):
     """Minimal subclass for testing base class file I/O."""
 
@@ -89,6 +134,15 @@ class _StubConverter(BaseConverter):
         return f"TITLE:{page.title}"
 
 
+class _SlowStubConverter(_StubConverter):
+    """Stub whose pages authored by "slow" take longer to render."""
+
+    def render_page(self, page: Page) -> str:
+        if page.author == "slow":
+            time.sleep(0.05)
+        return f"{page.title}:{page.author}"
+
+
 class TestBaseConverterConvertSection:
     """Tests for BaseConverter.convert_section via a stub subclass."""
 
@@ -116,6 +170,66 @@ class TestBaseConverterConvertSection:
         content = (tmp_path / "Test" / "Hello.txt").read_text()
         assert content == "TITLE:Hello"
 
+    def test_many_pages_keep_order_and_numbering(self, tmp_path, monkeypatch):
+        # Force a multi-worker pool even on single-CPU runners.
+        monkeypatch.setattr("onenote_export.converter.base.os.cpu_count", lambda: 8)
+        converter = _StubConverter(tmp_path)
+        section = Section(name="Test", pages=[Page(title="Notes")] * 12)
+        created = converter.convert_section(section)
+        names = [p.name for p in created]
+        assert names[0] == "Notes.txt"
+        assert names[1:] == [f"Notes ({n}).txt" for n in range(2, 13)]
+        assert all(p.exists() for p in created)
+
+    def test_colliding_page_filenames_resolve_to_last_page(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("onenote_export.converter.base.os.cpu_count", lambda: 8)
+        converter = _SlowStubConverter(tmp_path)
+        pages = [
+            Page(title="Notes", author="first"),
+            Page(title="Notes", author="slow"),
+            Page(title="Notes (2)", author="last"),
+        ]
+        converter.convert_section(Section(name="Test", pages=pages))
+        content = (tmp_path / "Test" / "Notes (2).txt").read_text()
+        assert content == "Notes (2):last"
+
+    def test_unnamed_images_across_pages_are_not_interleaved(
+        self, tmp_path, monkeypatch
+    ):
+        """Colliding per-page image names resolve to the last page's data."""
+        monkeypatch.setattr("onenote_export.converter.base.os.cpu_count", lambda: 8)
+        converter = _StubConverter(tmp_path)
+        payloads = [bytes([n]) * (1024 if n % 2 else 4 * 1024 * 1024) for n in range(8)]
+        pages = [
+            Page(title=f"P{n}", elements=[ImageElement(data=data, format="png")])
+            for n, data in enumerate(payloads)
+        ]
+        created = converter.convert_section(Section(name="Test", pages=pages))
+        image = tmp_path / "Test" / "images" / "image 001.png"
+        assert image.read_bytes() == payloads[-1]
+        assert created[:2] == [tmp_path / "Test" / "P0.txt", image]
+        assert created[-2:] == [tmp_path / "Test" / "P7.txt", image]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_new_files_respect_umask(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        old_umask = os.umask(0o002)
+        try:
+            created = converter.convert_section(
+                Section(name="Test", pages=[Page(title="Shared")])
+            )
+        finally:
+            os.umask(old_umask)
+        assert created[0].stat().st_mode & 0o777 == 0o664
+
+    def test_overwrites_existing_file_as_utf8(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        stale = tmp_path / "Test" / "Café.txt"
+        stale.parent.mkdir()
+        stale.write_text("x" * 100)
+        converter.convert_section(Section(name="Test", pages=[Page(title="Café")]))
+        assert stale.read_bytes() == "TITLE:Café".encode()
+
 
 class TestBaseConverterConvertNotebook:
     """Tests for BaseConverter.convert_notebook."""
@@ -139,8 +253,6 @@ class TestBaseConverterRenderPageAbstract:
 
     def test_raises_not_implemented(self):
         converter = BaseConverter(tempfile.gettempdir())
-        import pytest
-
         with pytest.raises(NotImplementedError):
             converter.render_page(Page(title="Test"))
 
@@ -163,12 +275,46 @@ class TestBaseConverterWriteImages:
             ],
         )
         converter.convert_section(section)
-        assert (tmp_path / "Test" / "images" / "pic.png").exists()
+        assert (tmp_path / "Test" / "images" / "pic.png").read_bytes() == png_header
+
+    def test_no_image_data_creates_no_directory(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        page = Page(title="Empty", elements=[ImageElement(filename="ref.png")])
+        converter.convert_section(Section(name="Test", pages=[page]))
+        assert not (tmp_path / "Test" / "images").exists()
 
 
 class TestBaseConverterWriteEmbeddedFiles:
     """Tests for _write_embedded_files."""
 
+    def test_streams_attachment_from_data_stream(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        payload = b"streamed" * 1000
+        streams: list[io.BytesIO] = []
+
+        def _open() -> io.BytesIO:
+            streams.append(io.BytesIO(payload))
+            return streams[-1]
+
+        page = Page(
+            title="Stream",
+            elements=[EmbeddedFile(filename="s.bin", data_stream=_open)],
+        )
+        converter.convert_section(Section(name="Test", pages=[page]))
+        written = (tmp_path / "Test" / "attachments" / "s.bin").read_bytes()
+        assert written == payload
+        assert streams[0].closed
+
+    def test_writes_large_attachment_intact(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        payload = bytes(range(256)) * (3 * 4096 + 1)  # just over 3 MiB
+        page = Page(
+            title="Big", elements=[EmbeddedFile(data=payload, filename="big.bin")]
+        )
+        converter.convert_section(Section(name="Test", pages=[page]))
+        written = (tmp_path / "Test" / "attachments" / "big.bin").read_bytes()
+        assert written == payload
+
     def test_writes_attachments(self, tmp_path):
         converter = _StubConverter(tmp_path)
         section = Section(
@@ -181,4 +327,6 @@ class TestBaseConverterWriteEmbeddedFiles:
             ],
         )
         converter.convert_section(section)
-        assert (tmp_path / "Test" / "attachments" / "doc.pdf").exists()
+        assert (tmp_path / "Test" / "attachments" / "doc.pdf").read_bytes() == (
+            b"pdf content"
+        )
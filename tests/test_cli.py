@@ -1,108 +1,214 @@
 """Tests for onenote_export.cli module."""
 
+import copy
 import logging
+import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from onenote_export.cli import main, _deduplicate_sections
+from onenote_export.model.section import Section
+from onenote_export.parser.one_store import ExtractedSection
+from tests._paths import NOTEBOOK_DIR
 
 
-TEST_DATA = Path(__file__).parent / "test_data"
-NOTEBOOK_DIR = TEST_DATA / "Example-NoteBook-1"
+def _has_one_files(directory: Path) -> bool:
+    """Return True if *directory* holds a .one file, stopping at the first."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith(".one") for entry in entries)
+    except OSError:
+        return False
+
+
+_HAS_TEST_DATA = _has_one_files(NOTEBOOK_DIR)
+
+
+def _use_cached_parser(
+    monkeypatch: pytest.MonkeyPatch,
+    parsed_notebook: dict[Path, ExtractedSection],
+    extracted_notebook: dict[Path, Section],
+) -> None:
+    """Serve main()'s parse and extract steps from the session-wide caches.
+
+    Only the CLI glue and the converters run; each call gets a shallow
+    copy of the cached Section because main() renames it in place.
+    """
+
+    class _CachedParser:
+        def __init__(self, file_path: str | Path) -> None:
+            self.file_path = Path(file_path)
+
+        def parse(self) -> ExtractedSection:
+            return parsed_notebook[self.file_path.resolve()]
 
-_HAS_TEST_DATA = NOTEBOOK_DIR.exists() and any(NOTEBOOK_DIR.glob("*.one"))
+    def _cached_extract(parsed: ExtractedSection) -> Section:
+        return copy.copy(extracted_notebook[Path(parsed.file_path).resolve()])
+
+    monkeypatch.setattr("onenote_export.cli.OneStoreParser", _CachedParser)
+    monkeypatch.setattr("onenote_export.cli.extract_section", _cached_extract)
+
+
+@pytest.fixture
+def cached_parser(monkeypatch, parsed_notebook, extracted_notebook) -> None:
+    """Per-test version of _use_cached_parser."""
+    _use_cached_parser(monkeypatch, parsed_notebook, extracted_notebook)
+
+
+def _run_export(
+    tmp_path_factory, parsed_notebook, extracted_notebook, name: str, *flags: str
+) -> SimpleNamespace:
+    """Run main() once on the example notebook and collect its outputs."""
+    out = tmp_path_factory.mktemp(name)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _use_cached_parser(monkeypatch, parsed_notebook, extracted_notebook)
+        rc = main(["-i", str(NOTEBOOK_DIR), "-o", str(out), *flags])
+    return SimpleNamespace(
+        rc=rc,
+        out=out,
+        md_files=sorted(out.rglob("*.md")),
+        html_files=sorted(out.rglob("*.html")),
+    )
+
+
+@pytest.fixture(scope="module")
+def exported_tree(
+    tmp_path_factory, parsed_notebook, extracted_notebook
+) -> SimpleNamespace:
+    """Default (nested, Markdown) export, run once per module."""
+    return _run_export(
+        tmp_path_factory, parsed_notebook, extracted_notebook, "exported"
+    )
+
+
+@pytest.fixture(scope="module")
+def exported_flat_tree(
+    tmp_path_factory, parsed_notebook, extracted_notebook
+) -> SimpleNamespace:
+    """--flat export, run once per module."""
+    return _run_export(
+        tmp_path_factory, parsed_notebook, extracted_notebook, "flat", "--flat"
+    )
+
+
+class _BrokenConverter:
+    """Converter stub whose writes always fail, counting the attempts."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.calls = 0
+
+    def convert_notebook(self, notebook) -> list[Path]:
+        self.calls += 1
+        raise RuntimeError("write failed")
+
+
+@pytest.fixture
+def broken_converter(monkeypatch) -> _BrokenConverter:
+    """Make cli.MarkdownConverter build a converter that always fails."""
+    converter = _BrokenConverter()
+    monkeypatch.setattr(
+        "onenote_export.cli.MarkdownConverter", lambda *args, **kwargs: converter
+    )
+    return converter
+
+
+_DEDUP_NAMES = {
+    "notes": "Notes.one",
+    "tasks": "Tasks.one",
+    "notes_dated": "Notes (On 2-25-26).one",
+    "adi_old": "ADI (On 10-3-22).one",
+    "adi_new": "ADI (On 2-25-26).one",
+    "adp_old": "ADP.one (On 8-24-22).one",
+    "adp_new": "ADP.one (On 8-24-25).one",
+    "two_digit_99": "Test (On 1-1-99).one",
+    "two_digit_24": "Test (On 1-1-24).one",
+}
+
+
+@pytest.fixture(scope="module")
+def dedup_corpus() -> SimpleNamespace:
+    """Section paths for _deduplicate_sections.
+
+    The function only looks at file names, so these are plain paths
+    with nothing behind them on disk.
+    """
+    return SimpleNamespace(
+        **{key: Path("notebook") / name for key, name in _DEDUP_NAMES.items()}
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_input_dir(tmp_path_factory) -> Path:
+    """A shared input directory with no .one files."""
+    return tmp_path_factory.mktemp("empty")
+
+
+@pytest.fixture(scope="module")
+def unwritten_output_dir(tmp_path_factory) -> Path:
+    """Output path for runs that must exit before writing; never created."""
+    return tmp_path_factory.getbasetemp() / "never-written"
 
 
 class TestDeduplicateSections:
     """Tests for _deduplicate_sections."""
 
-    def test_no_duplicates(self, tmp_path):
-        files = [
-            tmp_path / "Notes.one",
-            tmp_path / "Tasks.one",
-        ]
-        for f in files:
-            f.touch()
-        result = _deduplicate_sections(files)
-        assert len(result) == 2
-
-    def test_keeps_latest_version(self, tmp_path):
-        old = tmp_path / "ADI (On 10-3-22).one"
-        new = tmp_path / "ADI (On 2-25-26).one"
-        old.touch()
-        new.touch()
-        result = _deduplicate_sections([old, new])
-        assert len(result) == 1
-        assert result[0] == new
-
-    def test_dotone_date_pattern(self, tmp_path):
-        old = tmp_path / "ADP.one (On 8-24-22).one"
-        new = tmp_path / "ADP.one (On 8-24-25).one"
-        old.touch()
-        new.touch()
-        result = _deduplicate_sections([old, new])
-        assert len(result) == 1
-        assert result[0] == new
-
-    def test_undated_file_kept_when_no_dated_version(self, tmp_path):
-        f = tmp_path / "Notes.one"
-        f.touch()
-        result = _deduplicate_sections([f])
-        assert len(result) == 1
-        assert result[0] == f
-
-    def test_dated_wins_over_undated(self, tmp_path):
-        undated = tmp_path / "Notes.one"
-        dated = tmp_path / "Notes (On 2-25-26).one"
-        undated.touch()
-        dated.touch()
-        result = _deduplicate_sections([undated, dated])
-        assert len(result) == 1
-        assert result[0] == dated
+    def test_no_duplicates(self, dedup_corpus):
+        c = dedup_corpus
+        assert _deduplicate_sections([c.notes, c.tasks]) == [c.notes, c.tasks]
+
+    def test_keeps_latest_version(self, dedup_corpus):
+        c = dedup_corpus
+        assert _deduplicate_sections([c.adi_old, c.adi_new]) == [c.adi_new]
+
+    def test_dotone_date_pattern(self, dedup_corpus):
+        c = dedup_corpus
+        assert _deduplicate_sections([c.adp_old, c.adp_new]) == [c.adp_new]
+
+    def test_undated_file_kept_when_no_dated_version(self, dedup_corpus):
+        c = dedup_corpus
+        assert _deduplicate_sections([c.notes]) == [c.notes]
+
+    def test_dated_wins_over_undated(self, dedup_corpus):
+        c = dedup_corpus
+        assert _deduplicate_sections([c.notes, c.notes_dated]) == [c.notes_dated]
 
     def test_empty_list(self):
         assert _deduplicate_sections([]) == []
 
-    def test_two_digit_year_normalization(self, tmp_path):
-        old = tmp_path / "Test (On 1-1-99).one"  # 1999
-        new = tmp_path / "Test (On 1-1-24).one"  # 2024
-        old.touch()
-        new.touch()
-        result = _deduplicate_sections([old, new])
-        assert len(result) == 1
-        assert result[0] == new
+    def test_two_digit_year_normalization(self, dedup_corpus):
+        c = dedup_corpus
+        # 1-1-99 is 1999 and 1-1-24 is 2024
+        result = _deduplicate_sections([c.two_digit_99, c.two_digit_24])
+        assert result == [c.two_digit_24]
 
 
 @pytest.mark.skipif(not _HAS_TEST_DATA, reason="test_data not available")
+@pytest.mark.usefixtures("cached_parser")
 class TestMainHappyPath:
     """Tests for main() with real test data."""
 
-    def test_successful_export(self, tmp_path):
+    def test_successful_export(self, exported_tree):
         """main() returns 0 and creates output files."""
-        result = main(["-i", str(NOTEBOOK_DIR), "-o", str(tmp_path / "out")])
-        assert result == 0
-        out_dir = tmp_path / "out"
-        assert out_dir.exists()
-        md_files = list(out_dir.rglob("*.md"))
-        assert len(md_files) >= 1
+        assert exported_tree.rc == 0
+        assert exported_tree.out.exists()
+        assert len(exported_tree.md_files) >= 1
 
-    def test_flat_output(self, tmp_path):
+    def test_nested_output_has_notebook_dir(self, exported_tree):
+        """Default layout is <notebook>/<section>/<page>.md."""
+        for md in exported_tree.md_files:
+            assert md.relative_to(exported_tree.out).parts[0] == NOTEBOOK_DIR.name
+
+    def test_flat_output(self, exported_flat_tree):
         """--flat flag produces flat directory structure."""
-        result = main(
-            [
-                "-i",
-                str(NOTEBOOK_DIR),
-                "-o",
-                str(tmp_path / "flat_out"),
-                "--flat",
-            ]
-        )
-        assert result == 0
-        out_dir = tmp_path / "flat_out"
-        md_files = list(out_dir.rglob("*.md"))
-        assert len(md_files) >= 1
+        assert exported_flat_tree.rc == 0
+        assert len(exported_flat_tree.md_files) >= 1
+
+    def test_flat_output_has_no_notebook_dir(self, exported_flat_tree):
+        """--flat layout is <section>/<page>.md."""
+        for md in exported_flat_tree.md_files:
+            assert len(md.relative_to(exported_flat_tree.out).parts) == 2
 
     def test_format_html(self, tmp_path):
         """--format html produces .html files only."""
@@ -142,38 +248,28 @@ class TestMainHappyPath:
         assert len(html_files) >= 1
         assert len(md_files) >= 1
 
-    def test_default_format_is_markdown(self, tmp_path):
+    def test_default_format_is_markdown(self, exported_tree):
         """Default format produces only .md files."""
-        result = main(["-i", str(NOTEBOOK_DIR), "-o", str(tmp_path / "default_out")])
-        assert result == 0
-        out_dir = tmp_path / "default_out"
-        md_files = list(out_dir.rglob("*.md"))
-        html_files = list(out_dir.rglob("*.html"))
-        assert len(md_files) >= 1
-        assert len(html_files) == 0
+        assert exported_tree.rc == 0
+        assert len(exported_tree.md_files) >= 1
+        assert len(exported_tree.html_files) == 0
 
 
 class TestMainErrorHandling:
     """Tests for main() error paths."""
 
-    def test_missing_input_dir(self, tmp_path):
+    def test_missing_input_dir(self, empty_input_dir, unwritten_output_dir):
         """Returns 1 for non-existent input directory."""
-        result = main(
-            [
-                "-i",
-                str(tmp_path / "nonexistent"),
-                "-o",
-                str(tmp_path / "out"),
-            ]
-        )
+        missing = empty_input_dir / "nonexistent"
+        result = main(["-i", str(missing), "-o", str(unwritten_output_dir)])
         assert result == 1
+        assert not unwritten_output_dir.exists()
 
-    def test_empty_input_dir(self, tmp_path):
+    def test_empty_input_dir(self, empty_input_dir, unwritten_output_dir):
         """Returns 1 when no .one files found."""
-        empty_dir = tmp_path / "empty"
-        empty_dir.mkdir()
-        result = main(["-i", str(empty_dir), "-o", str(tmp_path / "out")])
+        result = main(["-i", str(empty_input_dir), "-o", str(unwritten_output_dir)])
         assert result == 1
+        assert not unwritten_output_dir.exists()
 
     def test_parse_error_collected(self, tmp_path):
         """Parse errors are collected but don't crash the CLI."""
@@ -186,98 +282,73 @@ class TestMainErrorHandling:
         assert result in (0, 2)
 
     @pytest.mark.skipif(not _HAS_TEST_DATA, reason="test_data not available")
-    def test_converter_error_handled(self, tmp_path):
+    @pytest.mark.usefixtures("cached_parser")
+    def test_converter_error_handled(self, tmp_path, broken_converter):
         """Converter errors are collected but don't crash."""
-        with patch("onenote_export.cli.MarkdownConverter") as mock_converter_cls:
-            mock_converter = MagicMock()
-            mock_converter.convert_notebook.side_effect = RuntimeError("write failed")
-            mock_converter_cls.return_value = mock_converter
-
-            result = main(
-                [
-                    "-i",
-                    str(NOTEBOOK_DIR),
-                    "-o",
-                    str(tmp_path / "out"),
-                ]
-            )
-            assert result in (0, 2)
+        result = main(["-i", str(NOTEBOOK_DIR), "-o", str(tmp_path / "out")])
+        assert result in (0, 2)
+        assert broken_converter.calls >= 1
 
 
 class TestFormatArgument:
     """Tests for --format argument parsing (no test data required)."""
 
-    def test_invalid_format_rejected(self, tmp_path, capsys):
+    def test_invalid_format_rejected(
+        self, empty_input_dir, unwritten_output_dir, capsys
+    ):
         """Invalid format value causes argparse error."""
         with pytest.raises(SystemExit) as exc_info:
             main(
                 [
                     "-i",
-                    str(tmp_path),
+                    str(empty_input_dir),
                     "-o",
-                    str(tmp_path / "out"),
+                    str(unwritten_output_dir),
                     "--format",
                     "pdf",
                 ]
             )
         assert exc_info.value.code == 2
 
-    def test_short_flag_works(self, tmp_path):
+    def test_short_flag_works(self, empty_input_dir, unwritten_output_dir):
         """Short -f flag works for format."""
-        empty_dir = tmp_path / "empty"
-        empty_dir.mkdir()
         # Will return 1 because no .one files, but argparse should not fail
-        result = main(["-i", str(empty_dir), "-o", str(tmp_path / "out"), "-f", "html"])
+        result = main(
+            ["-i", str(empty_input_dir), "-o", str(unwritten_output_dir), "-f", "html"]
+        )
         assert result == 1
 
 
-@pytest.mark.skipif(not _HAS_TEST_DATA, reason="test_data not available")
 class TestMainLogging:
-    """Tests for main() logging configuration."""
-
-    def test_verbose_sets_info_level(self, tmp_path):
-        """--verbose flag sets INFO logging."""
-        with patch("onenote_export.cli.logging.basicConfig") as mock_config:
-            main(
-                [
-                    "-i",
-                    str(NOTEBOOK_DIR),
-                    "-o",
-                    str(tmp_path / "out"),
-                    "--verbose",
-                ]
-            )
-            mock_config.assert_called_once()
-            call_kwargs = mock_config.call_args[1]
-            assert call_kwargs["level"] == logging.INFO
-
-    def test_debug_sets_debug_level(self, tmp_path):
-        """--debug flag sets DEBUG logging."""
-        with patch("onenote_export.cli.logging.basicConfig") as mock_config:
-            main(
-                [
-                    "-i",
-                    str(NOTEBOOK_DIR),
-                    "-o",
-                    str(tmp_path / "out"),
-                    "--debug",
-                ]
-            )
-            mock_config.assert_called_once()
-            call_kwargs = mock_config.call_args[1]
-            assert call_kwargs["level"] == logging.DEBUG
+    """Tests for main() logging configuration.
+
+    Logging is configured before input discovery, so these run against an
+    empty input directory and never parse or write anything.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _record_basic_config(self, monkeypatch):
+        """Record the kwargs of each logging.basicConfig call made by the CLI."""
+        self.basic_config_calls: list[dict] = []
+        monkeypatch.setattr(
+            "onenote_export.cli.logging.basicConfig",
+            lambda **kwargs: self.basic_config_calls.append(kwargs),
+        )
 
-    def test_default_warning_level(self, tmp_path):
-        """Default log level is WARNING."""
-        with patch("onenote_export.cli.logging.basicConfig") as mock_config:
-            main(
-                [
-                    "-i",
-                    str(NOTEBOOK_DIR),
-                    "-o",
-                    str(tmp_path / "out"),
-                ]
-            )
-            mock_config.assert_called_once()
-            call_kwargs = mock_config.call_args[1]
-            assert call_kwargs["level"] == logging.WARNING
+    @pytest.mark.parametrize(
+        "flags,level",
+        [
+            (["--verbose"], logging.INFO),
+            (["--debug"], logging.DEBUG),
+            ([], logging.WARNING),
+        ],
+        ids=["verbose", "debug", "default"],
+    )
+    def test_log_level(self, empty_input_dir, unwritten_output_dir, flags, level):
+        result = main(
+            ["-i", str(empty_input_dir), "-o", str(unwritten_output_dir), *flags]
+        )
+        # main() configured logging, then stopped at discovery without parsing
+        assert result == 1
+        assert len(self.basic_config_calls) == 1
+        assert self.basic_config_calls[0]["level"] == level
@@ -1,5 +1,7 @@
 """Tests for onenote_export.parser.content_extractor module."""
 
+import pytest
+
 from onenote_export.parser.content_extractor import (
     _as_bool,
     _build_top_level_oe_ids,
@@ -20,251 +22,283 @@ from onenote_export.parser.content_extractor import (
 from onenote_export.model.content import RichText, TextRun
 from onenote_export.parser.one_store import ExtractedObject
 
+# Encoded inputs shared by the parametrized decode/parse tables.
+_UTF16_HELLO = "Hello".encode("utf-16-le")
+_HEX_HELLO_ASCII = "48656c6c6f"  # "Hello" in hex
+_HEX_HI_UTF16 = "48006900"  # "Hi" as UTF-16LE hex
+_BYTES_14 = (14).to_bytes(2, "little")
+_BYTES_36 = (36).to_bytes(2, "little")
+_BYTES_100 = (100).to_bytes(4, "little")
+
+# CJK characters produced by decoding ASCII bytes as UTF-16LE.
+_GARBLED_SAMPLE = "\u4e48\u5f00\u53d1"
+_GARBLED_HELLO_WORLD = "Hello World".encode("ascii").decode(
+    "utf-16-le", errors="replace"
+)
+# Legitimate Japanese text (会議メモ) that the Unicode path must leave alone.
+_CJK_MEETING_NOTES = "\u4f1a\u8b70\u30e1\u30e2"
+
 
 class TestDecodeTextValue:
     """Tests for _decode_text_value."""
 
-    def test_plain_string(self):
-        assert _decode_text_value("Hello world") == "Hello world"
+    @pytest.mark.parametrize(
+        "value,encoding,expected",
+        [
+            ("Hello world", "unicode", "Hello world"),
+            ("", "unicode", ""),
+            ("   ", "unicode", ""),
+            (None, "unicode", ""),
+            (42, "unicode", "42"),
+            (_UTF16_HELLO, "unicode", "Hello"),
+            (b"Hello\x00", "ascii", "Hello"),
+            (_HEX_HELLO_ASCII, "ascii", "Hello"),
+            (_HEX_HI_UTF16, "unicode", "Hi"),
+            ("\u00a0" + _HEX_HI_UTF16 + "\u3000", "unicode", "Hi"),
+            ("abc", "ascii", "abc"),  # odd-length hex stays text
+            ("Hello\x00World", "unicode", "HelloWorld"),
+            (" Caf\u00e9\u202fau\ufffd lait\x00 ", "unicode", "Caf\u00e9 au lait"),
+            (_CJK_MEETING_NOTES, "unicode", _CJK_MEETING_NOTES),
+        ],
+        ids=[
+            "plain_string",
+            "empty_string",
+            "whitespace_only",
+            "none",
+            "integer",
+            "bytes_unicode",
+            "bytes_ascii",
+            "hex_ascii",
+            "hex_unicode",
+            "hex_unicode_nbsp_padded",
+            "odd_length_hex",
+            "null_bytes",
+            "non_ascii_cleaned",
+            "cjk_unicode_not_mangled",
+        ],
+    )
+    def test_decode(self, value, encoding, expected):
+        assert _decode_text_value(value, encoding=encoding) == expected
 
-    def test_empty_string(self):
-        assert _decode_text_value("") == ""
-
-    def test_none_value(self):
-        assert _decode_text_value(None) == ""
+    def test_garbled_ascii_re_encoding(self):
+        """Garbled CJK text re-encoded from UTF-16LE to ASCII."""
+        result = _decode_text_value(_GARBLED_HELLO_WORLD, encoding="ascii")
+        # Should attempt to re-encode and recover
+        assert isinstance(result, str)
 
-    def test_bytes_unicode(self):
-        text = "Hello"
-        raw = text.encode("utf-16-le")
+    def test_bytes_utf16_decode_error_falls_back_to_latin1(self):
+        """Invalid UTF-16LE bytes fall back to latin-1 decoding."""
+        # Odd-length bytes can't be valid UTF-16LE
+        raw = b"\xff\xfe\x80"
         result = _decode_text_value(raw, encoding="unicode")
-        assert result == "Hello"
-
-    def test_bytes_ascii(self):
-        raw = b"Hello\x00"
-        result = _decode_text_value(raw, encoding="ascii")
-        assert result == "Hello"
-
-    def test_hex_string_ascii(self):
-        raw = "48656c6c6f"  # "Hello" in hex
-        result = _decode_text_value(raw, encoding="ascii")
-        assert result == "Hello"
-
-    def test_string_with_null_bytes(self):
-        result = _decode_text_value("Hello\x00World")
-        assert "\x00" not in result
+        assert isinstance(result, str)
 
 
 class TestLooksGarbled:
     """Tests for _looks_garbled."""
 
-    def test_normal_text(self):
-        assert _looks_garbled("Hello world") is False
-
-    def test_empty_text(self):
-        assert _looks_garbled("") is False
-
-    def test_short_text(self):
-        assert _looks_garbled("ab") is False
-
-    def test_garbled_text(self):
-        # Simulate CJK characters from misinterpreted ASCII
-        garbled = "\u4e48\u5f00\u53d1"
-        assert _looks_garbled(garbled) is True
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Hello world", False),
+            ("", False),
+            ("ab", False),
+            (_GARBLED_SAMPLE, True),
+            (_GARBLED_HELLO_WORLD, True),
+        ],
+        ids=["normal", "empty", "short", "garbled", "garbled_hello_world"],
+    )
+    def test_looks_garbled(self, text, expected):
+        assert _looks_garbled(text) is expected
 
 
 class TestCleanText:
     """Tests for _clean_text."""
 
-    def test_removes_null_bytes(self):
-        assert _clean_text("hello\x00world") == "helloworld"
-
-    def test_strips_whitespace(self):
-        assert _clean_text("  hello  ") == "hello"
-
-    def test_empty_string(self):
-        assert _clean_text("") == ""
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("hello\x00world", "helloworld"),
+            ("  hello  ", "hello"),
+            ("", ""),
+        ],
+        ids=["null_bytes", "whitespace", "empty"],
+    )
+    def test_clean_text(self, text, expected):
+        assert _clean_text(text) == expected
 
 
 class TestAsBool:
     """Tests for _as_bool."""
 
-    def test_true_bool(self):
-        assert _as_bool(True) is True
-
-    def test_false_bool(self):
-        assert _as_bool(False) is False
-
-    def test_string_true(self):
-        assert _as_bool("true") is True
-        assert _as_bool("True") is True
-        assert _as_bool("1") is True
-        assert _as_bool("yes") is True
-
-    def test_string_false(self):
-        assert _as_bool("false") is False
-        assert _as_bool("no") is False
-        assert _as_bool("") is False
-
-    def test_integer(self):
-        assert _as_bool(1) is True
-        assert _as_bool(0) is False
-
-    def test_none(self):
-        assert _as_bool(None) is False
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (True, True),
+            (False, False),
+            ("true", True),
+            ("True", True),
+            ("1", True),
+            ("yes", True),
+            ("false", False),
+            ("no", False),
+            ("", False),
+            (1, True),
+            (0, False),
+            (None, False),
+        ],
+    )
+    def test_as_bool(self, value, expected):
+        assert _as_bool(value) is expected
 
 
 class TestParseIntProp:
     """Tests for _parse_int_prop."""
 
-    def test_int_value(self):
-        assert _parse_int_prop(42) == 42
-
-    def test_zero(self):
-        assert _parse_int_prop(0) == 0
-
-    def test_bytes_value(self):
-        raw = (100).to_bytes(4, "little")
-        assert _parse_int_prop(raw) == 100
-
-    def test_string_with_number(self):
-        assert _parse_int_prop("size: 12pt") == 12
-
-    def test_string_no_number(self):
-        assert _parse_int_prop("none") == 0
-
-    def test_none(self):
-        assert _parse_int_prop(None) == 0
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (42, 42),
+            (0, 0),
+            (_BYTES_100, 100),
+            (b"\x07", 7),
+            ("size: 12pt", 12),
+            ("none", 0),
+            (None, 0),
+        ],
+        ids=[
+            "int",
+            "zero",
+            "bytes",
+            "short_bytes",
+            "string_with_number",
+            "string_no_number",
+            "none",
+        ],
+    )
+    def test_parse(self, value, expected):
+        assert _parse_int_prop(value) == expected
+
+    def test_reads_at_most_width_bytes(self):
+        raw = (0x12345678).to_bytes(4, "little")
+        assert _parse_int_prop(raw, width=2) == 0x5678
 
 
 class TestParseFontSize:
     """Tests for _parse_font_size."""
 
-    def test_int_value(self):
-        assert _parse_font_size(11) == 11
-
-    def test_bytes_value(self):
-        raw = (14).to_bytes(2, "little")
-        assert _parse_font_size(raw) == 14
-
-    def test_string_value(self):
-        assert _parse_font_size("12") == 12
-
-    def test_zero(self):
-        assert _parse_font_size(0) == 0
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (11, 11),
+            (0, 0),
+            (_BYTES_14, 14),
+            (b"\x0e", 14),
+            (b"", 0),
+            ("12", 12),
+            ("normal", 0),
+            (None, 0),
+        ],
+        ids=[
+            "int",
+            "zero",
+            "bytes",
+            "single_byte",
+            "empty_bytes",
+            "string",
+            "string_no_number",
+            "none",
+        ],
+    )
+    def test_parse(self, value, expected):
+        assert _parse_font_size(value) == expected
 
 
 class TestDetectImageFormat:
     """Tests for _detect_image_format."""
 
-    def test_png(self):
-        data = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
-        assert _detect_image_format(data) == "png"
-
-    def test_jpeg(self):
-        data = b"\xff\xd8\xff\xe0" + b"\x00" * 100
-        assert _detect_image_format(data) == "jpeg"
-
-    def test_gif87a(self):
-        data = b"GIF87a" + b"\x00" * 100
-        assert _detect_image_format(data) == "gif"
-
-    def test_gif89a(self):
-        data = b"GIF89a" + b"\x00" * 100
-        assert _detect_image_format(data) == "gif"
-
-    def test_bmp(self):
-        data = b"BM" + b"\x00" * 100
-        assert _detect_image_format(data) == "bmp"
-
-    def test_webp(self):
-        data = b"RIFF\x00\x00\x00\x00WEBP" + b"\x00" * 100
-        assert _detect_image_format(data) == "webp"
-
-    def test_unknown_format(self):
-        data = b"\x00\x01\x02\x03" + b"\x00" * 100
-        assert _detect_image_format(data) == ""
-
-    def test_empty_data(self):
-        assert _detect_image_format(b"") == ""
-
-    def test_too_short(self):
-        assert _detect_image_format(b"\x89PN") == ""
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            (b"\x89PNG\r\n\x1a\n", "png"),
+            (b"\xff\xd8\xff\xe0", "jpeg"),
+            (b"GIF87a", "gif"),
+            (b"GIF89a", "gif"),
+            (b"BM\x00\x00", "bmp"),
+            (b"RIFF\x00\x00\x00\x00WEBP", "webp"),
+            (b"\x00\x01\x02\x03", ""),
+            (b"", ""),
+            (b"\x89PN", ""),
+        ],
+        ids=[
+            "png",
+            "jpeg",
+            "gif87a",
+            "gif89a",
+            "bmp",
+            "webp",
+            "unknown",
+            "empty",
+            "too_short",
+        ],
+    )
+    def test_detect(self, data, expected):
+        assert _detect_image_format(data) == expected
+
+
+def _rt(identity: str, text: str) -> ExtractedObject:
+    """A RichTextOENode carrying *text*."""
+    return ExtractedObject(
+        obj_type="jcidRichTextOENode",
+        identity=identity,
+        properties={"RichEditTextUnicode": text},
+    )
+
+
+def _oe(identity: str) -> ExtractedObject:
+    """A content-less OutlineElementNode."""
+    return ExtractedObject(obj_type="jcidOutlineElementNode", identity=identity)
 
 
 class TestDeduplicateObjects:
     """Tests for _deduplicate_objects."""
 
-    def test_fewer_than_4_objects_returned_unchanged(self):
-        objs = [
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="1",
-                properties={"RichEditTextUnicode": "Hello"},
-            ),
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="2",
-                properties={"RichEditTextUnicode": "World"},
-            ),
-        ]
-        result = _deduplicate_objects(objs)
-        assert len(result) == 2
-
-    def test_no_content_fingerprints_returns_unchanged(self):
-        """Objects with no content (styles, outlines) are returned as-is."""
-        objs = [
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="1"),
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="2"),
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="3"),
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="4"),
-        ]
-        result = _deduplicate_objects(objs)
-        assert len(result) == 4
-
-    def test_single_content_fp_returns_unchanged(self):
-        """Only one content fingerprint means no duplicates possible."""
-        objs = [
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="1"),
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="2",
-                properties={"RichEditTextUnicode": "Hello"},
-            ),
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="3"),
-            ExtractedObject(obj_type="jcidOutlineElementNode", identity="4"),
-        ]
-        result = _deduplicate_objects(objs)
-        assert len(result) == 4
-
-    def test_duplicates_removed(self):
-        """Duplicate content objects should be deduplicated."""
-        objs = [
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="1",
-                properties={"RichEditTextUnicode": "Hello"},
+    @pytest.mark.parametrize(
+        "objs,expected_ids",
+        [
+            ([], []),
+            ([_rt("1", "Hello"), _rt("2", "World")], ["1", "2"]),
+            ([_oe("1"), _oe("2"), _oe("3"), _oe("4")], ["1", "2", "3", "4"]),
+            (
+                [_oe("1"), _rt("2", "Hello"), _oe("3"), _oe("4")],
+                ["1", "2", "3", "4"],
             ),
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="2",
-                properties={"RichEditTextUnicode": "World"},
+            (
+                [
+                    _rt("1", "Hello"),
+                    _rt("2", "World"),
+                    _rt("3", "Hello"),
+                    _rt("4", "World"),
+                ],
+                ["1", "2"],
             ),
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="3",
-                properties={"RichEditTextUnicode": "Hello"},
-            ),
-            ExtractedObject(
-                obj_type="jcidRichTextOENode",
-                identity="4",
-                properties={"RichEditTextUnicode": "World"},
+            (
+                [_rt("1", "Hello"), _oe("2"), _rt("3", "Hello"), _oe("4")],
+                ["1", "2", "4"],
             ),
-        ]
+        ],
+        ids=[
+            "empty",
+            "fewer_than_4_unchanged",
+            "no_content_unchanged",
+            "single_content_unchanged",
+            "duplicates_removed",
+            "keeps_first_copy_and_non_content",
+        ],
+    )
+    def test_deduplicate(self, objs, expected_ids):
         result = _deduplicate_objects(objs)
-        assert len(result) == 2
-
-    def test_empty_list(self):
-        assert _deduplicate_objects([]) == []
+        assert [o.identity for o in result] == expected_ids
 
 
 class TestBuildTopLevelOeIds:
@@ -312,71 +346,34 @@ class TestBuildTopLevelOeIds:
         assert result == set()
 
 
-class TestDecodeTextEdgeCases:
-    """Additional edge case tests for _decode_text_value."""
-
-    def test_hex_string_unicode_encoding(self):
-        """Hex string decoded as UTF-16LE."""
-        # "Hi" in UTF-16LE = 48 00 69 00
-        result = _decode_text_value("48006900", encoding="unicode")
-        assert result == "Hi"
-
-    def test_garbled_ascii_re_encoding(self):
-        """Garbled CJK text re-encoded from UTF-16LE to ASCII."""
-        # Create text that looks garbled (> 30% non-ASCII)
-        ascii_text = "Hello World"
-        # Encode as UTF-16LE, then decode incorrectly as UTF-16LE to get garbled
-        garbled = ascii_text.encode("ascii").decode("utf-16-le", errors="replace")
-        result = _decode_text_value(garbled, encoding="ascii")
-        # Should attempt to re-encode and recover
-        assert isinstance(result, str)
-
-    def test_bytes_utf16_decode_error_falls_back_to_latin1(self):
-        """Invalid UTF-16LE bytes fall back to latin-1 decoding."""
-        # Odd-length bytes can't be valid UTF-16LE
-        raw = b"\xff\xfe\x80"
-        result = _decode_text_value(raw, encoding="unicode")
-        assert isinstance(result, str)
-
-    def test_integer_value(self):
-        """Non-string, non-bytes values are converted via str()."""
-        result = _decode_text_value(42)
-        assert result == "42"
-
-    def test_whitespace_only_string(self):
-        result = _decode_text_value("   ")
-        assert result == ""
-
-
 class TestParseBytePropAsInt:
     """Tests for _parse_byte_prop_as_int."""
 
-    def test_int_value(self):
-        assert _parse_byte_prop_as_int(36) == 36
-
-    def test_bytes_value(self):
-        raw = (36).to_bytes(2, "little")
-        assert _parse_byte_prop_as_int(raw) == 36
-
-    def test_repr_string(self):
-        """Parse repr() style byte string like b'$\\x00'."""
-        assert _parse_byte_prop_as_int("b'$\\x00'") == 36  # ord('$') = 36
-
-    def test_repr_string_hex(self):
-        assert _parse_byte_prop_as_int("b'\\x04\\x00'") == 4
-
-    def test_empty_string(self):
-        assert _parse_byte_prop_as_int("") == 0
-
-    def test_none(self):
-        assert _parse_byte_prop_as_int(None) == 0
-
-    def test_invalid_repr(self):
-        assert _parse_byte_prop_as_int("b'invalid") == 0
-
-    def test_short_bytes(self):
-        """Single byte should return 0 (need at least 2)."""
-        assert _parse_byte_prop_as_int(b"\x05") == 0
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (36, 36),
+            (_BYTES_36, 36),
+            ("b'$\\x00'", 36),  # repr() of bytes; ord('$') = 36
+            ("b'\\x04\\x00'", 4),
+            ("", 0),
+            (None, 0),
+            ("b'invalid", 0),
+            (b"\x05", 0),  # need at least 2 bytes
+        ],
+        ids=[
+            "int",
+            "bytes",
+            "repr_string",
+            "repr_string_hex",
+            "empty_string",
+            "none",
+            "invalid_repr",
+            "short_bytes",
+        ],
+    )
+    def test_parse(self, value, expected):
+        assert _parse_byte_prop_as_int(value) == expected
 
 
 class TestSectionNameFromPath:
@@ -399,23 +396,6 @@ class TestSectionNameFromPath:
         assert result == "Untitled"
 
 
-class TestParseFontSizeEdgeCases:
-    """Additional edge case tests for _parse_font_size."""
-
-    def test_none_value(self):
-        assert _parse_font_size(None) == 0
-
-    def test_string_no_number(self):
-        assert _parse_font_size("normal") == 0
-
-    def test_single_byte(self):
-        raw = b"\x0e"  # 14
-        assert _parse_font_size(raw) == 14
-
-    def test_empty_bytes(self):
-        assert _parse_font_size(b"") == 0
-
-
 class TestDedupElements:
     """Tests for _dedup_elements."""
 
@@ -426,6 +406,12 @@ class TestDedupElements:
         result = _dedup_elements([elem1, elem2])
         assert len(result) == 1
 
+    def test_key_is_joined_text_not_run_equality(self):
+        """Runs are never compared; only their joined text and list_type."""
+        plain = RichText(runs=[TextRun(text="Hello"), TextRun(text="world")])
+        bold = RichText(runs=[TextRun(text="Hello world", bold=True)])
+        assert _dedup_elements([plain, bold]) == [plain]
+
     def test_keeps_same_text_different_list_type(self):
         """Same text in different list types is not a duplicate."""
         run = TextRun(text="Item")
@@ -573,25 +559,6 @@ class TestParseHyperlinkFieldCodes:
         assert segments[2] == ("Link B", "https://b.com")
 
 
-class TestDecodeGarbledUnicode:
-    """Tests for garbled text detection in Unicode encoding path."""
-
-    def test_garbled_unicode_not_mangled(self):
-        """Unicode path should NOT apply garbled re-encoding (preserves real Unicode)."""
-        # Legitimate CJK text should pass through unchanged
-        cjk_text = "\u4f1a\u8b70\u30e1\u30e2"  # 会議メモ (Japanese)
-        result = _decode_text_value(cjk_text, encoding="unicode")
-        assert result == cjk_text
-
-    def test_garbled_ascii_still_fixed(self):
-        """ASCII path should still fix garbled text."""
-        ascii_text = "Hello World Test"
-        garbled = ascii_text.encode("ascii").decode("utf-16-le", errors="replace")
-        assert _looks_garbled(garbled), "Test fixture is not actually garbled"
-        result = _decode_text_value(garbled, encoding="ascii")
-        assert isinstance(result, str)
-
-
 class TestReorderByOutlineHierarchy:
     """Tests for _reorder_by_outline_hierarchy."""
 
@@ -1,6 +1,8 @@
 """Tests for onenote_export.converter.html module."""
 
-import tempfile
+from pathlib import Path
+
+import pytest
 
 from onenote_export.converter.html import HTMLConverter
 from onenote_export.model.content import (
@@ -14,258 +16,199 @@ from onenote_export.model.notebook import Notebook
 from onenote_export.model.page import Page
 from onenote_export.model.section import Section
 
+# Pages are never mutated by render_page, so the tables below share them.
+_TITLE_ONLY = Page(title="Test")
+_UNTITLED = Page()
+
+
+def _run_page(text: str, **run_kwargs) -> Page:
+    """A titled page holding one paragraph with a single formatted run."""
+    return Page(title="Test", elements=[RichText(runs=[TextRun(text, **run_kwargs)])])
+
+
+def _para_page(text: str, **para_kwargs) -> Page:
+    """A titled page holding one plain-run paragraph with *para_kwargs*."""
+    return Page(title="Test", elements=[RichText(runs=[TextRun(text)], **para_kwargs)])
+
+
+@pytest.fixture(scope="session")
+def html_out(tmp_path_factory) -> Path:
+    """Output root for the shared converter; rendering never writes to it."""
+    return tmp_path_factory.mktemp("html_converter_tests")
+
+
+@pytest.fixture(scope="module")
+def converter(html_out: Path) -> HTMLConverter:
+    """One converter shared by the rendering tests; render_page is stateless."""
+    return HTMLConverter(html_out)
 
-class TestHTMLDocument:
-    """Tests for HTML document structure."""
 
-    def setup_method(self):
-        self.converter = HTMLConverter(tempfile.gettempdir() + "/test_output")
+@pytest.fixture(scope="module")
+def default_rendered(converter: HTMLConverter) -> str:
+    """The document for a page with only a title, rendered once."""
+    return converter.render_page(_TITLE_ONLY)
 
-    def test_doctype_present(self):
-        page = Page(title="Test")
-        result = self.converter.render_page(page)
-        assert result.startswith("<!DOCTYPE html>")
 
-    def test_charset_meta(self):
-        page = Page(title="Test")
-        result = self.converter.render_page(page)
-        assert '<meta charset="utf-8">' in result
+@pytest.fixture(scope="module")
+def untitled_rendered(converter: HTMLConverter) -> str:
+    """The document for an empty page, rendered once."""
+    return converter.render_page(_UNTITLED)
 
-    def test_viewport_meta(self):
-        page = Page(title="Test")
-        result = self.converter.render_page(page)
-        assert 'name="viewport"' in result
-        assert "width=device-width" in result
 
-    def test_embedded_css(self):
-        page = Page(title="Test")
-        result = self.converter.render_page(page)
-        assert "<style>" in result
-        assert "font-family" in result
+class TestHTMLDocument:
+    """Tests for HTML document structure."""
 
-    def test_title_in_head(self):
-        page = Page(title="My Page")
-        result = self.converter.render_page(page)
-        assert "<title>My Page</title>" in result
+    def test_document_shell(self, default_rendered):
+        assert default_rendered.startswith("<!DOCTYPE html>")
+        assert '<meta charset="utf-8">' in default_rendered
+        assert 'name="viewport"' in default_rendered
+        assert "width=device-width" in default_rendered
+        assert "<style>" in default_rendered
+        assert "font-family" in default_rendered
+        assert "<title>Test</title>" in default_rendered
 
-    def test_untitled_page_title(self):
-        page = Page()
-        result = self.converter.render_page(page)
-        assert "<title>Untitled</title>" in result
+    def test_untitled_page_title(self, untitled_rendered):
+        assert "<title>Untitled</title>" in untitled_rendered
 
 
 class TestHTMLConverterRenderPage:
     """Tests for HTMLConverter.render_page."""
 
-    def setup_method(self):
-        self.converter = HTMLConverter(tempfile.gettempdir() + "/test_output")
-
-    def test_page_with_title(self):
+    def test_page_with_title(self, converter):
         page = Page(title="My Title")
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "<h1>My Title</h1>" in result
 
-    def test_page_with_author(self):
+    def test_page_with_author(self, converter):
         page = Page(title="Test", author="John Doe")
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "<footer>Author: John Doe</footer>" in result
         assert "<hr>" in result
 
-    def test_page_with_plain_text(self):
+    def test_page_with_plain_text(self, converter):
         page = Page(
             title="Test",
             elements=[RichText(runs=[TextRun(text="Hello world")])],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "<p>Hello world</p>" in result
 
-    def test_page_with_bold_text(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="important", bold=True)])],
-        )
-        result = self.converter.render_page(page)
-        assert "<strong>important</strong>" in result
-
-    def test_page_with_italic_text(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="emphasis", italic=True)])],
-        )
-        result = self.converter.render_page(page)
-        assert "<em>emphasis</em>" in result
-
-    def test_page_with_underline_text(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="underlined", underline=True)])],
-        )
-        result = self.converter.render_page(page)
-        assert "<u>underlined</u>" in result
-
-    def test_page_with_strikethrough(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="removed", strikethrough=True)])],
-        )
-        result = self.converter.render_page(page)
-        assert "<del>removed</del>" in result
-
-    def test_page_with_hyperlink(self):
-        page = Page(
-            title="Test",
-            elements=[
-                RichText(
-                    runs=[
-                        TextRun(
-                            text="click here",
-                            hyperlink_url="https://example.com",
-                        )
-                    ]
-                )
-            ],
-        )
-        result = self.converter.render_page(page)
-        assert '<a href="https://example.com">click here</a>' in result
-
-    def test_page_with_superscript(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="2", superscript=True)])],
-        )
-        result = self.converter.render_page(page)
-        assert "<sup>2</sup>" in result
-
-    def test_page_with_subscript(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="2", subscript=True)])],
-        )
-        result = self.converter.render_page(page)
-        assert "<sub>2</sub>" in result
-
-    def test_page_with_indented_text(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="list item")], indent_level=1)],
-        )
-        result = self.converter.render_page(page)
-        assert "<ul>" in result
-        assert "<li>list item</li>" in result
-
-    def test_page_with_nested_indent(self):
+    @pytest.mark.parametrize(
+        "page,needle",
+        [
+            (_run_page("important", bold=True), "<strong>important</strong>"),
+            (_run_page("emphasis", italic=True), "<em>emphasis</em>"),
+            (_run_page("underlined", underline=True), "<u>underlined</u>"),
+            (_run_page("removed", strikethrough=True), "<del>removed</del>"),
+            (
+                _run_page("click here", hyperlink_url="https://example.com"),
+                '<a href="https://example.com">click here</a>',
+            ),
+            (_run_page("2", superscript=True), "<sup>2</sup>"),
+            (_run_page("2", subscript=True), "<sub>2</sub>"),
+        ],
+        ids=[
+            "bold",
+            "italic",
+            "underline",
+            "strikethrough",
+            "hyperlink",
+            "superscript",
+            "subscript",
+        ],
+    )
+    def test_run_formatting(self, converter, page, needle):
+        assert needle in converter.render_page(page)
+
+    @pytest.mark.parametrize(
+        "page,needles",
+        [
+            (_para_page("list item", indent_level=1), ("<ul>", "<li>list item</li>")),
+            (_para_page("first", list_type="ordered"), ("<ol>", "<li>first</li>")),
+            (_para_page("item", list_type="unordered"), ("<ul>", "<li>item</li>")),
+            (
+                _para_page("centered", alignment="center"),
+                ('style="text-align: center"',),
+            ),
+            (_para_page("Heading", heading_level=2), ("<h2>Heading</h2>",)),
+        ],
+        ids=["indented", "ordered_list", "unordered_list", "alignment", "heading"],
+    )
+    def test_paragraph_formatting(self, converter, page, needles):
+        result = converter.render_page(page)
+        for needle in needles:
+            assert needle in result
+
+    def test_page_with_nested_indent(self, converter):
         page = Page(
             title="Test",
             elements=[RichText(runs=[TextRun(text="nested")], indent_level=3)],
         )
-        result = self.converter.render_page(page)
-        assert result.count("<ul>") >= 3
-
-    def test_page_with_ordered_list(self):
-        page = Page(
-            title="Test",
-            elements=[
-                RichText(
-                    runs=[TextRun(text="first")],
-                    list_type="ordered",
-                    indent_level=0,
-                )
-            ],
-        )
-        result = self.converter.render_page(page)
-        assert "<ol>" in result
-        assert "<li>first</li>" in result
-
-    def test_page_with_unordered_list(self):
-        page = Page(
-            title="Test",
-            elements=[
-                RichText(
-                    runs=[TextRun(text="item")],
-                    list_type="unordered",
-                    indent_level=0,
-                )
-            ],
-        )
-        result = self.converter.render_page(page)
-        assert "<ul>" in result
-        assert "<li>item</li>" in result
+        result = converter.render_page(page)
+        assert "<ul><ul><ul><li>nested</li></ul></ul></ul>" in result
 
-    def test_page_with_image(self):
+    def test_page_with_image(self, converter):
         page = Page(
             title="Test",
             elements=[
                 ImageElement(data=b"\x89PNG", filename="screenshot.png", format="png")
             ],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert '<img src="./images/screenshot.png"' in result
         assert 'alt="screenshot.png"' in result
 
-    def test_page_with_image_no_data(self):
+    def test_page_with_image_no_data(self, converter):
         page = Page(
             title="Test",
             elements=[ImageElement(filename="remote.png")],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert '<img src="remote.png"' in result
 
-    def test_page_with_embedded_file(self):
+    def test_page_with_embedded_file(self, converter):
         page = Page(
             title="Test",
             elements=[EmbeddedFile(data=b"content", filename="report.pdf")],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert '<a href="./attachments/report.pdf">report.pdf</a>' in result
 
-    def test_page_with_embedded_file_no_data(self):
+    def test_page_with_embedded_file_no_data(self, converter):
         page = Page(
             title="Test",
             elements=[EmbeddedFile(filename="missing.pdf")],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "<span>missing.pdf</span>" in result
 
-    def test_empty_page(self):
-        page = Page()
-        result = self.converter.render_page(page)
-        assert "<body>" in result
-        assert "</body>" in result
+    def test_empty_page(self, untitled_rendered):
+        assert "<body>" in untitled_rendered
+        assert "</body>" in untitled_rendered
 
-    def test_alignment(self):
-        page = Page(
-            title="Test",
-            elements=[
-                RichText(
-                    runs=[TextRun(text="centered")],
-                    alignment="center",
-                )
-            ],
-        )
-        result = self.converter.render_page(page)
-        assert 'style="text-align: center"' in result
+    def test_empty_runs_render_nothing(self, converter):
+        page = Page(title="Test", elements=[RichText(runs=[TextRun(text="")])])
+        result = converter.render_page(page)
+        assert "<p></p>" not in result
 
-    def test_headings(self):
+    def test_empty_list_item_still_rendered(self, converter):
         page = Page(
             title="Test",
             elements=[
-                RichText(
-                    runs=[TextRun(text="Heading")],
-                    heading_level=2,
-                )
+                RichText(runs=[TextRun(text=text)], list_type="ordered")
+                for text in ("a", "", "c")
             ],
         )
-        result = self.converter.render_page(page)
-        assert "<h2>Heading</h2>" in result
+        result = converter.render_page(page)
+        assert (
+            "<ol><li>a</li></ol>\n<ol><li></li></ol>\n<ol><li>c</li></ol>\n" in result
+        )
 
 
 class TestHTMLConverterRenderTable:
     """Tests for table rendering."""
 
-    def setup_method(self):
-        self.converter = HTMLConverter(tempfile.gettempdir() + "/test_output")
-
-    def test_simple_table(self):
+    def test_simple_table(self, converter):
         table = TableElement(
             rows=[
                 [
@@ -278,19 +221,19 @@ class TestHTMLConverterRenderTable:
                 ],
             ]
         )
-        result = self.converter._render_table(table)
+        result = converter._render_table(table)
         assert "<table>" in result
         assert "<th>" in result
         assert "<td>" in result
         assert "Header 1" in result
         assert "Cell 1" in result
 
-    def test_empty_table(self):
+    def test_empty_table(self, converter):
         table = TableElement(rows=[])
-        result = self.converter._render_table(table)
+        result = converter._render_table(table)
         assert result == ""
 
-    def test_table_with_formatted_cells(self):
+    def test_table_with_formatted_cells(self, converter):
         table = TableElement(
             rows=[
                 [
@@ -298,40 +241,33 @@ class TestHTMLConverterRenderTable:
                 ],
             ]
         )
-        result = self.converter._render_table(table)
+        result = converter._render_table(table)
         assert "<strong>bold</strong>" in result
 
 
 class TestHTMLEscaping:
     """Tests for XSS prevention via HTML escaping."""
 
-    def setup_method(self):
-        self.converter = HTMLConverter(tempfile.gettempdir() + "/test_output")
-
-    def test_escapes_angle_brackets(self):
+    def test_escapes_body_text(self, converter):
         page = Page(
             title="Test",
-            elements=[RichText(runs=[TextRun(text="<script>alert('xss')</script>")])],
+            elements=[
+                RichText(runs=[TextRun(text="<script>alert('xss')</script>")]),
+                RichText(runs=[TextRun(text="A & B")]),
+            ],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "<script>" not in result
         assert "&lt;script&gt;" in result
-
-    def test_escapes_ampersand(self):
-        page = Page(
-            title="Test",
-            elements=[RichText(runs=[TextRun(text="A & B")])],
-        )
-        result = self.converter.render_page(page)
         assert "A &amp; B" in result
 
-    def test_escapes_quotes_in_title(self):
+    def test_escapes_quotes_in_title(self, converter):
         page = Page(title='He said "hello"')
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         # Title in <title> and <h1> should be escaped
         assert "&quot;" in result or "He said" in result
 
-    def test_escapes_hyperlink_url(self):
+    def test_escapes_hyperlink_url(self, converter):
         page = Page(
             title="Test",
             elements=[
@@ -345,13 +281,13 @@ class TestHTMLEscaping:
                 )
             ],
         )
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "&amp;" in result
         assert "&quot;" in result
 
-    def test_escapes_author(self):
+    def test_escapes_author(self, converter):
         page = Page(title="Test", author="<script>bad</script>")
-        result = self.converter.render_page(page)
+        result = converter.render_page(page)
         assert "<script>bad</script>" not in result
         assert "&lt;script&gt;" in result
 
@@ -157,6 +157,21 @@ class TestMarkdownConverterRenderPage:
         result = self.converter.render_page(page)
         assert result.strip() == ""
 
+    def test_empty_runs_render_nothing(self):
+        rt = RichText(runs=[TextRun(text="")])
+        assert self.converter._render_rich_text(rt) == ""
+
+    def test_empty_ordered_item_keeps_numbering(self):
+        page = Page(
+            title="Test",
+            elements=[
+                RichText(runs=[TextRun(text=text)], list_type="ordered")
+                for text in ("a", "", "c")
+            ],
+        )
+        result = self.converter.render_page(page)
+        assert "1. a\n\n2. \n\n3. c\n" in result
+
 
 class TestMarkdownConverterRenderTable:
     """Tests for table rendering."""
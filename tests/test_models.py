@@ -75,6 +75,21 @@ class TestImageElement:
         assert img.format == "png"
 
 
+class TestHasData:
+    """Tests for the has_data property on binary elements."""
+
+    def test_inline_data(self):
+        assert ImageElement(data=b"x").has_data
+        assert EmbeddedFile(data=b"x").has_data
+
+    def test_stream_only(self):
+        assert EmbeddedFile(data_stream=lambda: None).has_data
+
+    def test_no_payload(self):
+        assert not ImageElement().has_data
+        assert not EmbeddedFile(filename="a.pdf").has_data
+
+
 class TestTableElement:
     """Tests for TableElement dataclass."""
 
@@ -111,6 +126,14 @@ class TestPage:
         assert page.title == "Test Page"
         assert len(page.elements) == 1
 
+    def test_typed_element_views(self):
+        img = ImageElement(data=b"x")
+        ef = EmbeddedFile(filename="a.pdf")
+        page = Page(elements=[RichText(), img, ef, ImageElement()])
+        assert page.images == [img, ImageElement()]
+        assert page.embedded_files == [ef]
+        assert page.images is page.images
+
 
 class TestSection:
     """Tests for Section dataclass."""
@@ -4,6 +4,7 @@ from onenote_export.parser.one_store import (
     ExtractedObject,
     ExtractedPage,
     ExtractedSection,
+    OneStoreParser,
     _clean_text,
     _extract_guid,
     _parse_int,
@@ -35,6 +36,69 @@ class TestExtractGuid:
         assert _extract_guid(identity) == "{12345678-abcd-ef01-2345-6789abcdef01}"
 
 
+def _obj(obj_type: str, guid: str, n: int = 1, **props: object) -> ExtractedObject:
+    return ExtractedObject(
+        obj_type=obj_type,
+        identity=f"<ExtendedGUID> ({guid}, {n})",
+        properties=props,
+    )
+
+
+class TestBuildPages:
+    """Tests for OneStoreParser._build_pages."""
+
+    def test_groups_content_by_page_node_guid(self):
+        objects = [
+            _obj("jcidPageMetaData", "a", CachedTitleString="First"),
+            _obj("jcidPageNode", "a"),
+            _obj("jcidRichTextOENode", "a", 2),
+            _obj("jcidPageMetaData", "b", CachedTitleString="Second"),
+            _obj("jcidPageNode", "b"),
+            _obj("jcidPageNode", "b", 2),
+            _obj("jcidRichTextOENode", "b", 3),
+            _obj("jcidImageNode", "b", 4),
+        ]
+        pages = OneStoreParser("x.one")._build_pages(objects)
+        assert [p.title for p in pages] == ["First", "Second"]
+        assert [len(p.objects) for p in pages] == [1, 2]
+
+    def test_page_without_meta_uses_orphan_meta(self):
+        objects = [
+            _obj("jcidPageMetaData", "old", CachedTitleString="Orphan"),
+            _obj("jcidPageNode", "new"),
+            _obj("jcidRichTextOENode", "new", 2),
+        ]
+        pages = OneStoreParser("x.one")._build_pages(objects)
+        assert [p.title for p in pages] == ["Orphan"]
+
+    def test_duplicate_title_keeps_fuller_revision_in_place(self):
+        objects = [
+            _obj("jcidPageMetaData", "a", CachedTitleString="Notes"),
+            _obj("jcidPageNode", "a"),
+            _obj("jcidRichTextOENode", "a", 2),
+            _obj("jcidPageMetaData", "b", CachedTitleString="Other"),
+            _obj("jcidPageNode", "b"),
+            _obj("jcidPageMetaData", "c", CachedTitleString="notes "),
+            _obj("jcidPageNode", "c"),
+            _obj("jcidRichTextOENode", "c", 2),
+            _obj("jcidRichTextOENode", "c", 3),
+        ]
+        pages = OneStoreParser("x.one")._build_pages(objects)
+        assert [p.title for p in pages] == ["notes", "Other"]
+        assert len(pages[0].objects) == 2
+
+    def test_no_meta_collects_all_content(self):
+        objects = [
+            _obj("jcidRichTextOENode", "a"),
+            _obj("jcidSectionNode", "a", 2),
+            _obj("jcidImageNode", "b"),
+        ]
+        pages = OneStoreParser("x.one")._build_pages(objects)
+        assert len(pages) == 1
+        assert pages[0].title == ""
+        assert len(pages[0].objects) == 2
+
+
 class TestCleanText:
     """Tests for _clean_text in one_store module."""
 
@@ -96,6 +160,10 @@ class TestExtractedDataclasses:
         assert obj.identity == "id-1"
         assert obj.properties == {}
 
+    def test_extracted_object_has_no_instance_dict(self):
+        obj = ExtractedObject(obj_type="test", identity="id-1")
+        assert not hasattr(obj, "__dict__")
+
     def test_extracted_object_with_properties(self):
         props = {"Bold": True, "Font": "Arial"}
         obj = ExtractedObject(obj_type="text", identity="id-2", properties=props)
@@ -1,5 +1,7 @@
 """Tests for onenote_export.parser.properties module."""
 
+import pytest
+
 from onenote_export.parser.properties import (
     BOLD,
     CACHED_TITLE_STRING,
@@ -39,47 +41,27 @@ from onenote_export.parser.properties import (
 class TestPropertyType:
     """Tests for PropertyType enum."""
 
-    def test_no_data(self):
-        assert PropertyType.NO_DATA == 0x01
-
-    def test_bool(self):
-        assert PropertyType.BOOL == 0x02
-
-    def test_one_byte(self):
-        assert PropertyType.ONE_BYTE == 0x03
-
-    def test_two_bytes(self):
-        assert PropertyType.TWO_BYTES == 0x04
-
-    def test_four_bytes(self):
-        assert PropertyType.FOUR_BYTES == 0x05
-
-    def test_eight_bytes(self):
-        assert PropertyType.EIGHT_BYTES == 0x06
-
-    def test_four_bytes_length_data(self):
-        assert PropertyType.FOUR_BYTES_OF_LENGTH_FOLLOWED_BY_DATA == 0x07
-
-    def test_object_id(self):
-        assert PropertyType.OBJECT_ID == 0x08
-
-    def test_array_of_object_ids(self):
-        assert PropertyType.ARRAY_OF_OBJECT_IDS == 0x09
-
-    def test_object_space_id(self):
-        assert PropertyType.OBJECT_SPACE_ID == 0x0A
-
-    def test_array_of_object_space_ids(self):
-        assert PropertyType.ARRAY_OF_OBJECT_SPACE_IDS == 0x0B
-
-    def test_context_id(self):
-        assert PropertyType.CONTEXT_ID == 0x0C
-
-    def test_array_of_context_ids(self):
-        assert PropertyType.ARRAY_OF_CONTEXT_IDS == 0x0D
-
-    def test_array_of_property_values(self):
-        assert PropertyType.ARRAY_OF_PROPERTY_VALUES == 0x10
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("NO_DATA", 0x01),
+            ("BOOL", 0x02),
+            ("ONE_BYTE", 0x03),
+            ("TWO_BYTES", 0x04),
+            ("FOUR_BYTES", 0x05),
+            ("EIGHT_BYTES", 0x06),
+            ("FOUR_BYTES_OF_LENGTH_FOLLOWED_BY_DATA", 0x07),
+            ("OBJECT_ID", 0x08),
+            ("ARRAY_OF_OBJECT_IDS", 0x09),
+            ("OBJECT_SPACE_ID", 0x0A),
+            ("ARRAY_OF_OBJECT_SPACE_IDS", 0x0B),
+            ("CONTEXT_ID", 0x0C),
+            ("ARRAY_OF_CONTEXT_IDS", 0x0D),
+            ("ARRAY_OF_PROPERTY_VALUES", 0x10),
+        ],
+    )
+    def test_value(self, name, value):
+        assert PropertyType[name] == value
 
     def test_enum_member_count(self):
         assert len(PropertyType) == 14
@@ -88,53 +70,29 @@ class TestPropertyType:
 class TestJCIDType:
     """Tests for JCIDType enum."""
 
-    def test_page_node(self):
-        assert JCIDType.PAGE_NODE == 0x0006000B
-
-    def test_outline_node(self):
-        assert JCIDType.OUTLINE_NODE == 0x0006000C
-
-    def test_outline_element_node(self):
-        assert JCIDType.OUTLINE_ELEMENT_NODE == 0x0006000D
-
-    def test_rich_text_oe_node(self):
-        assert JCIDType.RICH_TEXT_OE_NODE == 0x0006000E
-
-    def test_image_node(self):
-        assert JCIDType.IMAGE_NODE == 0x00060011
-
-    def test_table_node(self):
-        assert JCIDType.TABLE_NODE == 0x00060022
-
-    def test_table_row_node(self):
-        assert JCIDType.TABLE_ROW_NODE == 0x00060023
-
-    def test_table_cell_node(self):
-        assert JCIDType.TABLE_CELL_NODE == 0x00060024
-
-    def test_embedded_file_node(self):
-        assert JCIDType.EMBEDDED_FILE_NODE == 0x00060035
-
-    def test_section_node(self):
-        assert JCIDType.SECTION_NODE == 0x00060007
-
-    def test_page_series_node(self):
-        assert JCIDType.PAGE_SERIES_NODE == 0x00060008
-
-    def test_page_meta_data(self):
-        assert JCIDType.PAGE_META_DATA == 0x00020030
-
-    def test_section_meta_data(self):
-        assert JCIDType.SECTION_META_DATA == 0x00020031
-
-    def test_number_list_node(self):
-        assert JCIDType.NUMBER_LIST_NODE == 0x00060012
-
-    def test_title_node(self):
-        assert JCIDType.TITLE_NODE == 0x0006002C
-
-    def test_paragraph_style_object(self):
-        assert JCIDType.PARAGRAPH_STYLE_OBJECT == 0x0012004D
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("PAGE_NODE", 0x0006000B),
+            ("OUTLINE_NODE", 0x0006000C),
+            ("OUTLINE_ELEMENT_NODE", 0x0006000D),
+            ("RICH_TEXT_OE_NODE", 0x0006000E),
+            ("IMAGE_NODE", 0x00060011),
+            ("TABLE_NODE", 0x00060022),
+            ("TABLE_ROW_NODE", 0x00060023),
+            ("TABLE_CELL_NODE", 0x00060024),
+            ("EMBEDDED_FILE_NODE", 0x00060035),
+            ("SECTION_NODE", 0x00060007),
+            ("PAGE_SERIES_NODE", 0x00060008),
+            ("PAGE_META_DATA", 0x00020030),
+            ("SECTION_META_DATA", 0x00020031),
+            ("NUMBER_LIST_NODE", 0x00060012),
+            ("TITLE_NODE", 0x0006002C),
+            ("PARAGRAPH_STYLE_OBJECT", 0x0012004D),
+        ],
+    )
+    def test_value(self, name, value):
+        assert JCIDType[name] == value
 
     def test_enum_member_count(self):
         assert len(JCIDType) == 26
@@ -196,13 +154,12 @@ class TestPropertyIndexExtraction:
     def test_zero_property(self):
         assert property_index(0) == 0
 
-    def test_round_trip(self):
+    @pytest.mark.parametrize(
+        "prop_id", list(PROPERTY_NAMES), ids=list(PROPERTY_NAMES.values())
+    )
+    def test_round_trip(self, prop_id):
         """Verify type and index can reconstruct the original property ID."""
-        for prop_id in [BOLD, FONT, ROW_COUNT, PICTURE_CONTAINER]:
-            ptype = property_type(prop_id)
-            pidx = property_index(prop_id)
-            reconstructed = (ptype << 26) | pidx
-            assert reconstructed == prop_id
+        assert (property_type(prop_id) << 26) | property_index(prop_id) == prop_id
 
 
 class TestPropertyNames: